@@ -0,0 +1,104 @@
+import argparse
+import concurrent.futures
+import dataclasses
+import glob
+import json
+import multiprocessing
+import os
+import sys
+import time
+import typing
+
+from benchmark import DAYS, PARTS, TIMEOUT_SECONDS, import_day_module, run_isolated
+
+
+@dataclasses.dataclass
+class BatchResult:
+    day: int
+    part: str
+    filename: str
+    answer: typing.Any = None
+    seconds: typing.Optional[float] = None
+    error: typing.Optional[str] = None
+
+
+def solve(day: int, part: str, filename: str) -> BatchResult:
+    result = BatchResult(day, part, filename)
+    try:
+        solver = getattr(import_day_module(day), part)
+        start = time.perf_counter()
+        try:
+            result.answer = solver(filename)
+        finally:
+            result.seconds = time.perf_counter() - start
+    except Exception as exception:
+        result.error = f"{type(exception).__name__}: {exception}"
+    return result
+
+
+def solve_isolated(
+    day: int, part: str, filename: str, timeout: typing.Optional[float]
+) -> BatchResult:
+    # Each run gets its own process, so one that never finishes can be
+    # terminated without holding up the rest of the batch.
+    try:
+        return run_isolated(solve, (day, part, filename), timeout)
+    except multiprocessing.TimeoutError:
+        error = f"TimeoutError: no answer after {timeout} seconds"
+    except Exception as exception:
+        error = f"{type(exception).__name__}: {exception}"
+    return BatchResult(day, part, filename, error=error)
+
+
+def run_batch(
+    day: int,
+    filenames: typing.Iterable[str],
+    parts: typing.Iterable[str] = PARTS,
+    workers: typing.Optional[int] = None,
+    timeout: typing.Optional[float] = TIMEOUT_SECONDS,
+) -> typing.Iterator[BatchResult]:
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(solve_isolated, day, part, filename, timeout)
+            for filename in filenames
+            for part in parts
+        ]
+        for future in concurrent.futures.as_completed(futures):
+            yield future.result()
+
+
+def parse_arguments(arguments: typing.Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Run one day's solvers over many input files in parallel."
+    )
+    parser.add_argument("day", type=int, choices=DAYS)
+    parser.add_argument("pattern", help="glob of input files, e.g. 'inputs/*.txt'")
+    parser.add_argument("--parts", nargs="+", default=PARTS, choices=PARTS)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="runs at once (default: number of cores)",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=TIMEOUT_SECONDS,
+        help=f"seconds allowed per run (default: {TIMEOUT_SECONDS:g})",
+    )
+    return parser.parse_args(arguments)
+
+
+def main(arguments: typing.Optional[list[str]] = None):
+    args = parse_arguments(arguments)
+    filenames = sorted(glob.glob(args.pattern, recursive=True))
+    if not filenames:
+        sys.exit(f"No input files match {args.pattern}")
+    for result in run_batch(
+        args.day, filenames, args.parts, args.workers, args.timeout
+    ):
+        print(json.dumps(dataclasses.asdict(result), default=repr), flush=True)
+
+
+if __name__ == "__main__":
+    main()
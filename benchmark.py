@@ -0,0 +1,507 @@
+import argparse
+import dataclasses
+import gc
+import importlib
+import json
+import multiprocessing
+import pathlib
+import platform
+import random
+import string
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import types
+import typing
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+DAYS = (1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 18)
+PARTS = ("part1", "part2")
+SCALES = (1, 10, 100, 1000)
+REPORT_FILENAME = "benchmark_report.json"
+TIMEOUT_SECONDS = 60.0
+
+# day15 part2 scans a fixed 4,000,000 rows whatever the input size, and day11
+# and day18 part2 are unsolved stubs.
+EXCLUDED_PARTS = {(11, "part2"), (15, "part2"), (18, "part2")}
+
+InputGenerator = typing.Callable[[int, random.Random], str]
+
+
+def import_day_module(day: int) -> types.ModuleType:
+    return importlib.import_module(f"day{day:02d}")
+
+
+def generate_day01(scale: int, rng: random.Random) -> str:
+    elves = []
+    for _ in range(250 * scale):
+        food = [str(rng.randint(1000, 9999)) for _ in range(rng.randint(1, 15))]
+        elves.append("\n".join(food))
+    return "\n\n".join(elves) + "\n"
+
+
+def generate_day02(scale: int, rng: random.Random) -> str:
+    return "".join(
+        f"{rng.choice('ABC')} {rng.choice('XYZ')}\n" for _ in range(2500 * scale)
+    )
+
+
+def generate_day03(scale: int, rng: random.Random) -> str:
+    items = string.ascii_letters
+    lines = []
+    for _ in range(100 * scale):
+        badge = rng.choice(items)
+        for _ in range(3):
+            common = rng.choice(items)
+            half_length = rng.randint(8, 16)
+            first_half = [rng.choice(items[:26]) for _ in range(half_length - 1)]
+            second_half = [rng.choice(items[26:]) for _ in range(half_length - 1)]
+            first_half.append(common)
+            second_half.append(badge)
+            rng.shuffle(first_half)
+            rng.shuffle(second_half)
+            lines.append("".join(first_half + second_half))
+    return "\n".join(lines) + "\n"
+
+
+def generate_day04(scale: int, rng: random.Random) -> str:
+    lines = []
+    for _ in range(1000 * scale):
+        ids = []
+        for _ in range(2):
+            id_start = rng.randint(1, 99)
+            ids.append(f"{id_start}-{rng.randint(id_start, 99)}")
+        lines.append(",".join(ids))
+    return "\n".join(lines) + "\n"
+
+
+def generate_day05(scale: int, rng: random.Random) -> str:
+    stack_qty = 9
+    stacks = [
+        [rng.choice(string.ascii_uppercase) for _ in range(rng.randint(1, 8))]
+        for _ in range(stack_qty)
+    ]
+    drawing = []
+    for height in range(max(len(stack) for stack in stacks) - 1, -1, -1):
+        drawing.append(
+            " ".join(
+                f"[{stack[height]}]" if height < len(stack) else "   "
+                for stack in stacks
+            )
+        )
+    drawing.append(" ".join(f" {index} " for index in range(1, stack_qty + 1)))
+
+    procedures = []
+    for _ in range(500 * scale):
+        from_index = rng.choice(
+            [index for index, stack in enumerate(stacks) if len(stack) > 1]
+        )
+        to_index = rng.choice(
+            [index for index in range(stack_qty) if index != from_index]
+        )
+        qty = rng.randint(1, len(stacks[from_index]) - 1)
+        stacks[to_index].extend(stacks[from_index][-qty:])
+        del stacks[from_index][-qty:]
+        procedures.append(f"move {qty} from {from_index + 1} to {to_index + 1}")
+    return "\n".join(drawing) + "\n\n" + "\n".join(procedures) + "\n"
+
+
+def generate_day06(scale: int, rng: random.Random) -> str:
+    # Three letters never form a marker, so the whole stream gets scanned.
+    noise = "".join(rng.choice("abc") for _ in range(4096 * scale))
+    return noise + "".join(rng.sample(string.ascii_lowercase, 14)) + "\n"
+
+
+def generate_day07(scale: int, rng: random.Random) -> str:
+    # Keep the disk around 55,000,000 used so part2 has something to free.
+    max_file_size = 110_000_000 // (200 * scale)
+    lines = ["$ cd /"]
+    directory_count = 0
+    depth = 0
+    while directory_count < 200 * scale:
+        lines.append("$ ls")
+        child_names = [f"d{directory_count}_{index}" for index in range(3)]
+        lines.extend(f"dir {name}" for name in child_names)
+        for index in range(rng.randint(1, 5)):
+            lines.append(f"{rng.randint(1, max_file_size)} f{index}.txt")
+        directory_count += len(child_names)
+        if depth > 1 and rng.random() < 0.4:
+            up = rng.randint(1, depth - 1)
+            lines.extend("$ cd .." for _ in range(up))
+            depth -= up
+        lines.append(f"$ cd {rng.choice(child_names)}")
+        depth += 1
+    return "\n".join(lines) + "\n"
+
+
+def generate_day08(scale: int, rng: random.Random) -> str:
+    side = int(99 * scale**0.5)
+    return "".join(
+        "".join(rng.choice(string.digits) for _ in range(side)) + "\n"
+        for _ in range(side)
+    )
+
+
+def generate_day09(scale: int, rng: random.Random) -> str:
+    return "".join(
+        f"{rng.choice('URDL')} {rng.randint(1, 19)}\n" for _ in range(2000 * scale)
+    )
+
+
+def generate_day10(scale: int, rng: random.Random) -> str:
+    lines = []
+    for _ in range(140 * scale):
+        if rng.random() < 0.3:
+            lines.append("noop")
+        else:
+            lines.append(f"addx {rng.randint(-10, 10)}")
+    return "\n".join(lines) + "\n"
+
+
+def generate_day11(scale: int, rng: random.Random) -> str:
+    monkey_qty = 8
+    divisors = (2, 3, 5, 7, 11, 13, 17, 19)
+    monkeys = []
+    for monkey_id in range(monkey_qty):
+        items = ", ".join(str(rng.randint(50, 99)) for _ in range(4 * scale))
+        # "* old" is left out: squaring overflows the float division in part1.
+        operation = rng.choice(("+ 3", "+ 7", "* 2", "* 19"))
+        true_id, false_id = rng.sample(
+            [other_id for other_id in range(monkey_qty) if other_id != monkey_id], 2
+        )
+        monkeys.append(
+            f"Monkey {monkey_id}:\n"
+            f"  Starting items: {items}\n"
+            f"  Operation: new = old {operation}\n"
+            f"  Test: divisible by {divisors[monkey_id]}\n"
+            f"    If true: throw to monkey {true_id}\n"
+            f"    If false: throw to monkey {false_id}"
+        )
+    return "\n\n".join(monkeys) + "\n"
+
+
+def generate_day12(scale: int, rng: random.Random) -> str:
+    height = int(41 * scale**0.5)
+    width = max(26, int(170 * scale**0.5))
+    rows = []
+    for _ in range(height):
+        rows.append(
+            [
+                string.ascii_lowercase[-(-x_index * 25 // (width - 1))]
+                for x_index in range(width)
+            ]
+        )
+    rows[rng.randrange(height)][0] = "S"
+    rows[rng.randrange(height)][width - 1] = "E"
+    return "".join("".join(row) + "\n" for row in rows)
+
+
+def random_packet(rng: random.Random, depth: int = 0) -> list:
+    packet = []
+    for _ in range(rng.randint(0, 4)):
+        if depth < 3 and rng.random() < 0.3:
+            packet.append(random_packet(rng, depth + 1))
+        else:
+            packet.append(rng.randint(0, 10))
+    return packet
+
+
+def generate_day13(scale: int, rng: random.Random) -> str:
+    pairs = []
+    for _ in range(150 * scale):
+        packets = []
+        while len(packets) < 2:
+            packet = random_packet(rng)
+            if packet not in ([[2]], [[6]]):  # the divider packets
+                packets.append(json.dumps(packet, separators=(",", ":")))
+        pairs.append("\n".join(packets))
+    return "\n\n".join(pairs) + "\n"
+
+
+def generate_day14(scale: int, rng: random.Random) -> str:
+    # Sand only comes to rest at the source (500,0) once every cell down its
+    # right diagonal (x - y == 500) is blocked, which in the end needs rock on
+    # it. Keeping rock off that diagonal means sand always finds the void.
+    lines = ["495,25 -> 505,25"]
+    while len(lines) <= 5 * scale:
+        y = rng.randint(5, 20 + scale)
+        x_start = rng.randint(480, 515)
+        x_end = x_start + rng.randint(1, 6)
+        y_top = y - rng.randint(1, 3)
+        if x_start <= y + 500 <= x_end or y_top <= x_end - 500 <= y:
+            continue
+        lines.append(f"{x_start},{y} -> {x_end},{y} -> {x_end},{y_top}")
+    return "\n".join(lines) + "\n"
+
+
+def generate_day15(scale: int, rng: random.Random) -> str:
+    lines = []
+    for _ in range(25 * scale):
+        sensor_x = rng.randint(0, 4000000)
+        sensor_y = rng.randint(1500000, 2500000)
+        beacon_x = sensor_x + rng.randint(-600000, 600000)
+        beacon_y = sensor_y + rng.randint(-600000, 600000)
+        lines.append(
+            f"Sensor at x={sensor_x}, y={sensor_y}: "
+            f"closest beacon is at x={beacon_x}, y={beacon_y}"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def generate_day18(scale: int, rng: random.Random) -> str:
+    side = max(2, int(20 * scale ** (1 / 3)))
+    cubes = {
+        (rng.randrange(side), rng.randrange(side), rng.randrange(side))
+        for _ in range(2800 * scale)
+    }
+    return "".join(f"{x},{y},{z}\n" for x, y, z in sorted(cubes))
+
+
+INPUT_GENERATORS: dict[int, InputGenerator] = {
+    1: generate_day01,
+    2: generate_day02,
+    3: generate_day03,
+    4: generate_day04,
+    5: generate_day05,
+    6: generate_day06,
+    7: generate_day07,
+    8: generate_day08,
+    9: generate_day09,
+    10: generate_day10,
+    11: generate_day11,
+    12: generate_day12,
+    13: generate_day13,
+    14: generate_day14,
+    15: generate_day15,
+    18: generate_day18,
+}
+
+
+def write_input(
+    day: int, scale: int, directory: pathlib.Path, seed: int = 0
+) -> pathlib.Path:
+    rng = random.Random(f"{seed}-{day}-{scale}")
+    path = directory / f"day{day:02d}_x{scale}.txt"
+    path.write_text(INPUT_GENERATORS[day](scale, rng))
+    return path
+
+
+@dataclasses.dataclass
+class Measurement:
+    day: int
+    part: str
+    scale: int
+    input_bytes: int
+    answer: typing.Any = None
+    wall_seconds: typing.Optional[float] = None
+    peak_rss_kib: typing.Optional[int] = None
+    traced_peak_bytes: typing.Optional[int] = None
+    # Blocks allocated by the solver and still held by it when it returns.
+    allocated_blocks: typing.Optional[int] = None
+    error: typing.Optional[str] = None
+    timed_out: bool = False
+
+
+def peak_rss_kib() -> typing.Optional[int]:
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def time_part(
+    day: int, part: str, filename: str
+) -> tuple[typing.Any, float, typing.Optional[int]]:
+    solver = getattr(import_day_module(day), part)
+    gc.collect()
+    start = time.perf_counter()
+    answer = solver(filename)
+    wall_seconds = time.perf_counter() - start
+    return answer, wall_seconds, peak_rss_kib()
+
+
+def trace_part(day: int, part: str, filename: str) -> tuple[int, int]:
+    solver = getattr(import_day_module(day), part)
+    allocated_blocks = 0
+
+    def trace_solver_return(frame: types.FrameType, event: str, arg: typing.Any):
+        # Count the traced blocks as the solver returns, while its data is
+        # still referenced from its locals.
+        nonlocal allocated_blocks
+        if event == "return":
+            snapshot = tracemalloc.take_snapshot()
+            allocated_blocks = sum(
+                statistic.count for statistic in snapshot.statistics("filename")
+            )
+        return trace_solver_return
+
+    def trace_calls(frame: types.FrameType, event: str, arg: typing.Any):
+        return trace_solver_return if frame.f_code is solver.__code__ else None
+
+    gc.collect()
+    tracemalloc.start()
+    sys.settrace(trace_calls)
+    try:
+        solver(filename)
+        _, traced_peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        sys.settrace(None)
+        tracemalloc.stop()
+    return traced_peak_bytes, allocated_blocks
+
+
+def run_isolated(
+    function: typing.Callable, args: tuple, timeout: typing.Optional[float] = None
+) -> typing.Any:
+    # A fresh interpreter per run keeps ru_maxrss specific to that run, and
+    # leaving the pool terminates a run that is still going after the timeout.
+    with multiprocessing.get_context("spawn").Pool(processes=1) as pool:
+        return pool.apply_async(function, args).get(timeout)
+
+
+def measure(
+    day: int,
+    part: str,
+    scale: int,
+    filename: pathlib.Path,
+    trace: bool = True,
+    timeout: typing.Optional[float] = TIMEOUT_SECONDS,
+) -> Measurement:
+    measurement = Measurement(day, part, scale, filename.stat().st_size)
+    try:
+        (
+            measurement.answer,
+            measurement.wall_seconds,
+            measurement.peak_rss_kib,
+        ) = run_isolated(time_part, (day, part, str(filename)), timeout)
+    except multiprocessing.TimeoutError:
+        measurement.timed_out = True
+        measurement.error = f"TimeoutError: no answer after {timeout} seconds"
+        return measurement
+    except Exception as exception:
+        measurement.error = f"{type(exception).__name__}: {exception}"
+        return measurement
+    if trace:
+        # Tracing slows the solver down several times, so a traced run that
+        # times out keeps the timed answer and doesn't skip larger scales.
+        try:
+            (
+                measurement.traced_peak_bytes,
+                measurement.allocated_blocks,
+            ) = run_isolated(trace_part, (day, part, str(filename)), timeout)
+        except multiprocessing.TimeoutError:
+            measurement.error = f"TimeoutError: no trace after {timeout} seconds"
+        except Exception as exception:
+            measurement.error = f"{type(exception).__name__}: {exception}"
+    return measurement
+
+
+def git_commit() -> typing.Optional[str]:
+    try:
+        return subprocess.run(
+            ("git", "rev-parse", "HEAD"),
+            capture_output=True,
+            check=True,
+            text=True,
+            cwd=pathlib.Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(
+    days: typing.Iterable[int],
+    parts: typing.Iterable[str],
+    scales: typing.Iterable[int],
+    input_directory: pathlib.Path,
+    trace: bool = True,
+    timeout: typing.Optional[float] = TIMEOUT_SECONDS,
+) -> typing.Iterator[Measurement]:
+    for day in days:
+        # Once a part times out, larger inputs would only time out too.
+        timed_out_parts: set[str] = set()
+        for scale in sorted(scales):
+            filename = write_input(day, scale, input_directory)
+            for part in parts:
+                if (day, part) in EXCLUDED_PARTS:
+                    continue
+                if part in timed_out_parts:
+                    yield Measurement(
+                        day,
+                        part,
+                        scale,
+                        filename.stat().st_size,
+                        error="Skipped after timing out on a smaller input",
+                        timed_out=True,
+                    )
+                    continue
+                measurement = measure(day, part, scale, filename, trace, timeout)
+                if measurement.timed_out:
+                    timed_out_parts.add(part)
+                yield measurement
+
+
+def parse_arguments(arguments: typing.Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Time each day's part1/part2 against generated inputs."
+    )
+    parser.add_argument("--days", type=int, nargs="+", default=DAYS, choices=DAYS)
+    parser.add_argument("--parts", nargs="+", default=PARTS, choices=PARTS)
+    parser.add_argument("--scales", type=int, nargs="+", default=SCALES)
+    parser.add_argument("--output", type=pathlib.Path, default=REPORT_FILENAME)
+    parser.add_argument(
+        "--input-dir",
+        type=pathlib.Path,
+        help="keep the generated inputs in this directory",
+    )
+    parser.add_argument(
+        "--no-trace",
+        action="store_true",
+        help="skip the tracemalloc run used for the allocation figures",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=TIMEOUT_SECONDS,
+        help=f"seconds allowed per run (default: {TIMEOUT_SECONDS:g})",
+    )
+    return parser.parse_args(arguments)
+
+
+def main(arguments: typing.Optional[list[str]] = None):
+    args = parse_arguments(arguments)
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        input_directory = args.input_dir or pathlib.Path(temporary_directory)
+        input_directory.mkdir(parents=True, exist_ok=True)
+        measurements = []
+        for measurement in run_benchmarks(
+            args.days,
+            args.parts,
+            args.scales,
+            input_directory,
+            not args.no_trace,
+            args.timeout,
+        ):
+            print(
+                f"day{measurement.day:02d} {measurement.part} x{measurement.scale}: "
+                f"{measurement.error or f'{measurement.wall_seconds:.3f}s'}",
+                file=sys.stderr,
+            )
+            measurements.append(dataclasses.asdict(measurement))
+
+    report = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": measurements,
+    }
+    args.output.write_text(json.dumps(report, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
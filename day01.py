@@ -1,14 +1,22 @@
+import heapq
 from dataclasses import dataclass, field
 from operator import methodcaller
-from typing import Iterator
+from typing import Iterable, Iterator
 
-FILENAME = "day1_data.txt"
+from puzzle_input import (
+    BLOCK_SIZE,
+    map_file,
+    np,
+    require_numpy,
+    yield_line_blocks,
+    yield_stripped_lines as yield_data,
+)
 
+FILENAME = "day1_data.txt"
 
-def yield_data(filename: str) -> Iterator[str]:
-    with open(file=filename, mode="r") as read_file:
-        for line in read_file:
-            yield line.strip()
+NEWLINE = ord("\n")
+ZERO = ord("0")
+NINE = ord("9")
 
 
 @dataclass
@@ -33,28 +41,115 @@ def create_calories(data: Iterator[str]) -> list[Calorie]:
 
 
 def get_max_calorie(calories: list[Calorie]) -> Calorie:
-    max_calorie = calories[0]
-    for calorie in calories[1:]:
-        if calorie.sum() > max_calorie.sum():
-            max_calorie = calorie
-    return max_calorie
+    return max(calories, key=methodcaller("sum"))
 
 
 def get_top_three_calories(calories: list[Calorie]) -> list[Calorie]:
-    top_three_calories: list[Calorie] = []
-    for calorie in calories:
-        top_three_calories.append(calorie)
-        top_three_calories.sort(key=methodcaller("sum"))
-        top_three_calories = top_three_calories[-3:]
-    return top_three_calories
+    return heapq.nlargest(3, calories, key=methodcaller("sum"))[::-1]
+
+
+def yield_calorie_totals(data: Iterator[str]) -> Iterator[int]:
+    calorie_total = 0
+    for line in data:
+        if not line:
+            yield calorie_total
+            calorie_total = 0
+        else:
+            calorie_total += int(line)
+    yield calorie_total
+
+
+def get_top_calorie_totals(calorie_totals: Iterable[int], k: int) -> list[int]:
+    top_calorie_totals: list[int] = []
+    for calorie_total in calorie_totals:
+        if len(top_calorie_totals) < k:
+            heapq.heappush(top_calorie_totals, calorie_total)
+        elif top_calorie_totals and calorie_total > top_calorie_totals[0]:
+            heapq.heapreplace(top_calorie_totals, calorie_total)
+    return sorted(top_calorie_totals)
+
+
+def create_block_calorie_totals_array(block: bytes) -> "np.ndarray":
+    buffer = np.frombuffer(block, dtype=np.uint8)
+    if not buffer.size:
+        return np.zeros(1, dtype=np.int64)
+
+    # Pad with newlines so every line and number has a boundary on both sides.
+    padded = np.empty(buffer.size + 2, dtype=np.uint8)
+    padded[0] = padded[-1] = NEWLINE
+    padded[1:-1] = buffer
+    is_digit = ((padded >= ZERO) & (padded <= NINE)).astype(np.int8)
+    digit_changes = np.diff(is_digit)
+    number_starts = np.flatnonzero(digit_changes == 1) + 1
+    number_lengths = np.flatnonzero(digit_changes == -1) + 1 - number_starts
+    food_calories = np.zeros(number_starts.size, dtype=np.int64)
+    for offset in range(number_lengths.max(initial=0)):
+        has_digit = number_lengths > offset
+        food_calories[has_digit] = food_calories[has_digit] * 10 + (
+            padded[number_starts[has_digit] + offset] - ZERO
+        )
+
+    newlines = np.flatnonzero(padded == NEWLINE)
+    if buffer[-1] == NEWLINE:  # the final newline doesn't start another line
+        newlines = newlines[:-1]
+    numbers_before_line = np.searchsorted(number_starts, newlines)
+    blank_lines = np.flatnonzero(np.diff(numbers_before_line) == 0)
+    segment_offsets = numbers_before_line[blank_lines]
+    segment_starts = np.concatenate(([0], segment_offsets))
+    segment_ends = np.concatenate((segment_offsets, [food_calories.size]))
+
+    calorie_totals = np.zeros(segment_starts.size, dtype=np.int64)
+    non_empty = segment_starts < segment_ends
+    if food_calories.size:
+        calorie_totals[non_empty] = np.add.reduceat(
+            food_calories, segment_starts[non_empty]
+        )
+    return calorie_totals
+
+
+def create_calorie_totals_array(
+    filename: str, block_size: int = BLOCK_SIZE
+) -> "np.ndarray":
+    require_numpy()
+    # Blocks end on a line break rather than a blank line, so the last total
+    # of a block carries into the first total of the next.
+    block_calorie_totals = []
+    carried_total = 0
+    for block in yield_line_blocks(map_file(filename), block_size):
+        calorie_totals = create_block_calorie_totals_array(block)
+        calorie_totals[0] += carried_total
+        carried_total = int(calorie_totals[-1])
+        block_calorie_totals.append(calorie_totals[:-1])
+    block_calorie_totals.append(np.array([carried_total], dtype=np.int64))
+    return np.concatenate(block_calorie_totals)
+
+
+def get_top_calorie_totals_array(calorie_totals: "np.ndarray", k: int) -> "np.ndarray":
+    if k >= calorie_totals.size:
+        return np.sort(calorie_totals)
+    if k < 1:
+        return calorie_totals[:0]
+    return np.sort(np.partition(calorie_totals, -k)[-k:])
+
+
+def part1(filename: str, use_numpy: bool = False) -> int:
+    if use_numpy:
+        return int(create_calorie_totals_array(filename).max())
+    data = yield_data(filename)
+    return max(yield_calorie_totals(data))
+
+
+def part2(filename: str, use_numpy: bool = False) -> int:
+    if use_numpy:
+        calorie_totals = create_calorie_totals_array(filename)
+        return int(get_top_calorie_totals_array(calorie_totals, 3).sum())
+    data = yield_data(filename)
+    return sum(get_top_calorie_totals(yield_calorie_totals(data), 3))
 
 
 def main():
-    data = yield_data(FILENAME)
-    calories = create_calories(data)
-    top_three_calories = get_top_three_calories(calories)
-    total = sum(calorie.sum() for calorie in top_three_calories)
-    print(f"{total=}")
+    print(part1(FILENAME))
+    print(part2(FILENAME))
 
 
 if __name__ == "__main__":
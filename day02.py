@@ -1,14 +1,12 @@
+import collections
 import dataclasses
 import enum
+import itertools
 from typing import Iterator
 
-FILENAME = "day2_data.txt"
-
+from puzzle_input import BLOCK_SIZE, map_file, yield_line_blocks
 
-def yield_data(filename: str) -> Iterator[str]:
-    with open(file=filename, mode="r") as read_file:
-        for line in read_file:
-            yield line.strip()
+FILENAME = "day2_data.txt"
 
 
 class Shape(enum.Enum):
@@ -27,7 +25,7 @@ shape_conversion = {
 }
 
 
-def strategy2_conversion(player1: str, player2: str) -> Shape:
+def find_strategy2_shape(player1: str, player2: str) -> Shape:
     shape = shape_conversion[player1]
     if player2 == "X":
         for key, value in round_states.items():
@@ -57,24 +55,43 @@ round_states: dict[tuple[Shape, Shape], tuple[RoundOutcome, RoundOutcome]] = {
 }
 
 
+def create_round_scores() -> dict[tuple[Shape, Shape], tuple[int, int]]:
+    round_scores: dict[tuple[Shape, Shape], tuple[int, int]] = {}
+    for choices in itertools.product(Shape, repeat=2):
+        round_outcome = round_states.get(
+            choices, (RoundOutcome.DRAW, RoundOutcome.DRAW)
+        )
+        round_scores[choices] = (
+            choices[0].value + round_outcome[0],
+            choices[1].value + round_outcome[1],
+        )
+    return round_scores
+
+
+round_scores = create_round_scores()
+
+strategy2_shapes: dict[tuple[str, str], Shape] = {
+    (player1, player2): find_strategy2_shape(player1, player2)
+    for player1, player2 in itertools.product("ABC", "XYZ")
+}
+
+
+def strategy2_conversion(player1: str, player2: str) -> Shape:
+    return strategy2_shapes[player1, player2]
+
+
 @dataclasses.dataclass
 class Round:
     choices: tuple[Shape, Shape]
 
     def score(self) -> tuple[int, int]:
-        round_outcome = round_states.get(
-            self.choices, (RoundOutcome.DRAW, RoundOutcome.DRAW)
-        )
-        return (
-            self.choices[0].value + round_outcome[0],
-            self.choices[1].value + round_outcome[1],
-        )
+        return round_scores[self.choices]
 
     def player1_score(self) -> int:
-        return self.score()[0]
+        return round_scores[self.choices][0]
 
     def player2_score(self) -> int:
-        return self.score()[1]
+        return round_scores[self.choices][1]
 
 
 def create_rounds(lines: Iterator[str], part1: bool = True) -> list[Round]:
@@ -93,11 +110,50 @@ def create_rounds(lines: Iterator[str], part1: bool = True) -> list[Round]:
     return rounds
 
 
+strategy_guide_lines = tuple(
+    f"{player1} {player2}" for player1, player2 in itertools.product("ABC", "XYZ")
+)
+
+
+def create_line_scores(part1: bool = True) -> dict[bytes, int]:
+    line_scores: dict[bytes, int] = {}
+    for line in strategy_guide_lines:
+        (round,) = create_rounds(iter((line,)), part1)
+        line_scores[line.encode()] = round.player2_score()
+    return line_scores
+
+
+part1_line_scores = create_line_scores()
+part2_line_scores = create_line_scores(False)
+
+
+def count_strategy_guide_lines(
+    filename: str, block_size: int = BLOCK_SIZE
+) -> collections.Counter[bytes]:
+    line_counts: collections.Counter[bytes] = collections.Counter()
+    for block in yield_line_blocks(map_file(filename), block_size):
+        for line in part1_line_scores:
+            line_counts[line] += block.count(line)
+    return line_counts
+
+
+def score_line_counts(
+    line_counts: collections.Counter[bytes], line_scores: dict[bytes, int]
+) -> int:
+    return sum(line_counts[line] * score for line, score in line_scores.items())
+
+
+def part1(filename: str) -> int:
+    return score_line_counts(count_strategy_guide_lines(filename), part1_line_scores)
+
+
+def part2(filename: str) -> int:
+    return score_line_counts(count_strategy_guide_lines(filename), part2_line_scores)
+
+
 def main():
-    data = yield_data(FILENAME)
-    rounds = create_rounds(data, False)
-    player2_score = sum(round.player2_score() for round in rounds)
-    print(player2_score)
+    print(part1(FILENAME))
+    print(part2(FILENAME))
 
 
 if __name__ == "__main__":
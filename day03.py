@@ -1,8 +1,14 @@
+import collections
 import dataclasses
 from typing import Iterator
 import typing
 import enum
+import functools
 import itertools
+import operator
+from string import ascii_letters
+
+from puzzle_input import yield_stripped_lines as yield_data
 
 FILENAME = "day3_data.txt"
 
@@ -12,12 +18,6 @@ class PriorityShift(enum.IntEnum):
     UPPERCASE = 38
 
 
-def yield_data(filename: str) -> Iterator[str]:
-    with open(file=filename, mode="r") as read_file:
-        for line in read_file:
-            yield line.strip()
-
-
 def split_string_in_half(string: str) -> tuple[str, str]:
     string_length = len(string) // 2
     return string[:string_length], string[string_length:]
@@ -32,6 +32,41 @@ def rucksack_item_priority(item: str) -> int:
     return ord(item) - shift
 
 
+item_priority_bits: dict[str, int] = {
+    item: 1 << rucksack_item_priority(item) for item in ascii_letters
+}
+priority_items: dict[int, str] = {
+    rucksack_item_priority(item): item for item in ascii_letters
+}
+ALL_ITEMS_MASK = functools.reduce(operator.or_, item_priority_bits.values())
+
+
+# Bits are distinct, so summing the bits of distinct items ORs them in C.
+def items_mask(items: str) -> int:
+    return sum(map(item_priority_bits.__getitem__, set(items)))
+
+
+def common_items_mask(items: typing.Iterable[str]) -> int:
+    # Intersecting sets runs in C, leaving only the few common items to map.
+    items = iter(items)
+    first_items = next(items, None)
+    if first_items is None:
+        return ALL_ITEMS_MASK
+    common = set(first_items).intersection(*items)
+    return sum(map(item_priority_bits.__getitem__, common))
+
+
+def mask_prioritys(mask: int) -> Iterator[int]:
+    while mask:
+        lowest_bit = mask & -mask
+        yield lowest_bit.bit_length() - 1
+        mask ^= lowest_bit
+
+
+def mask_items(mask: int) -> str:
+    return "".join(priority_items[priority] for priority in mask_prioritys(mask))
+
+
 @dataclasses.dataclass
 class Comparment:
     items: str
@@ -44,9 +79,20 @@ class RuckShack:
     def compartments_common_item(self):
         return common_items([compartment.items for compartment in self.compartments])
 
+    def compartments_common_mask(self) -> int:
+        return common_items_mask(
+            compartment.items for compartment in self.compartments
+        )
+
     def all_items(self) -> str:
         return "".join(compartment.items for compartment in self.compartments)
 
+    def items_mask(self) -> int:
+        mask = 0
+        for compartment in self.compartments:
+            mask |= items_mask(compartment.items)
+        return mask
+
 
 def create_badly_packed_rucksacks(lines: Iterator[str]) -> Iterator[RuckShack]:
     for line in lines:
@@ -61,8 +107,15 @@ def sum_rucksacks_prioritys(rucksacks: Iterator[RuckShack]) -> int:
     priority_score_sum = 0
     for rucksack in rucksacks:
         rucksack: RuckShack
-        for priority_item in rucksack.compartments_common_item():
-            priority_score_sum += rucksack_item_priority(priority_item)
+        priority_score_sum += sum(mask_prioritys(rucksack.compartments_common_mask()))
+    return priority_score_sum
+
+
+def sum_badly_packed_prioritys(lines: Iterator[str]) -> int:
+    priority_score_sum = 0
+    for line in lines:
+        common_mask = common_items_mask(split_string_in_half(line))
+        priority_score_sum += sum(mask_prioritys(common_mask))
     return priority_score_sum
 
 
@@ -83,21 +136,95 @@ def sum_rucksack_group_prioritys(rucksack_groups: Iterator[tuple[RuckShack]]):
     priority_score_sum = 0
     for rucksack_group in rucksack_groups:
         rucksack_group: tuple[RuckShack]
-        rucksack_common_items = common_items(
-            [rucksack.all_items() for rucksack in rucksack_group]
-        )
-        for priority_item in rucksack_common_items:
-            priority_score_sum += rucksack_item_priority(priority_item)
+        common_mask = ALL_ITEMS_MASK
+        for rucksack in rucksack_group:
+            common_mask &= rucksack.items_mask()
+        priority_score_sum += sum(mask_prioritys(common_mask))
     return priority_score_sum
 
 
-def main():
-    lines = yield_data(FILENAME)
-    print(sum_rucksacks_prioritys(create_badly_packed_rucksacks(lines)))
+@dataclasses.dataclass
+class RucksackWindow:
+    size: int
+    masks: collections.deque[int] = dataclasses.field(
+        default_factory=collections.deque, init=False
+    )
+    priority_counts: list[int] = dataclasses.field(
+        default_factory=lambda: [0] * (len(priority_items) + 1), init=False
+    )
+    common_mask: int = dataclasses.field(default=0, init=False)
+
+    @property
+    def is_full(self) -> bool:
+        return len(self.masks) == self.size
+
+    def add_rucksack_mask(self, mask: int) -> None:
+        if self.is_full:
+            self.remove_oldest_rucksack_mask()
+        self.masks.append(mask)
+        for priority in mask_prioritys(mask):
+            self.priority_counts[priority] += 1
+            if self.priority_counts[priority] == self.size:
+                self.common_mask |= 1 << priority
+
+    def remove_oldest_rucksack_mask(self) -> None:
+        for priority in mask_prioritys(self.masks.popleft()):
+            if self.priority_counts[priority] == self.size:
+                self.common_mask &= ~(1 << priority)
+            self.priority_counts[priority] -= 1
+
+
+def check_group_step(group_size: int, step: typing.Optional[int]) -> int:
+    if group_size < 1:
+        raise ValueError(f"group_size must be at least 1, not {group_size}")
+    if step is None:
+        return group_size
+    if step < 1:
+        raise ValueError(f"step must be at least 1, not {step}")
+    return step
+
+
+def yield_window_common_masks(
+    rucksack_masks: typing.Iterable[int],
+    group_size: int,
+    step: typing.Optional[int] = None,
+) -> Iterator[int]:
+    # Non-overlapping groups by default, a step of 1 slides the window.
+    step = check_group_step(group_size, step)
+    rucksack_window = RucksackWindow(group_size)
+    for count, mask in enumerate(rucksack_masks, 1):
+        rucksack_window.add_rucksack_mask(mask)
+        if rucksack_window.is_full and (count - group_size) % step == 0:
+            yield rucksack_window.common_mask
+
+
+def sum_group_prioritys(
+    lines: Iterator[str], group_size: int, step: typing.Optional[int] = None
+) -> int:
+    step = check_group_step(group_size, step)
+    if step == group_size:
+        # Plain groups need no per-item counts, only the intersection of each.
+        common_masks = map(common_items_mask, grouper(lines, group_size, ""))
+    else:
+        common_masks = yield_window_common_masks(
+            map(items_mask, lines), group_size, step
+        )
+    return sum(sum(mask_prioritys(common_mask)) for common_mask in common_masks)
+
+
+def part1(filename: str) -> int:
+    lines = yield_data(filename)
+    return sum_badly_packed_prioritys(lines)
+
 
-    lines = yield_data(FILENAME)
-    rucksack_groups = group_rucksacks(create_badly_packed_rucksacks(lines), 3)
-    print(sum_rucksack_group_prioritys(rucksack_groups))
+def part2(filename: str) -> int:
+    lines = yield_data(filename)
+    return sum_group_prioritys(lines, 3)
+
+
+def main():
+    print(part1(FILENAME))
+    print(part2(FILENAME))
 
 
 if __name__ == "__main__":
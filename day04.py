@@ -1,14 +1,19 @@
+import bisect
 import dataclasses
 from typing import Iterator
 
+from puzzle_input import (
+    map_file,
+    np,
+    require_numpy,
+    yield_line_blocks,
+    yield_stripped_lines as yield_data,
+)
 
 FILENAME = "day4_data.txt"
 
-
-def yield_data(filename: str) -> Iterator[str]:
-    with open(file=filename, mode="r") as read_file:
-        for line in read_file:
-            yield line.strip()
+ID_SEPARATORS = bytes.maketrans(b",-", b"  ")
+MIN_ROW_SIZE = len(b"1-1,1-1\n")
 
 
 @dataclasses.dataclass(frozen=True)
@@ -45,22 +50,193 @@ def create_assignment_pairs(lines: Iterator[str]) -> Iterator[AssignmentIdPairs]
         yield AssignmentIdPairs(first_id_pair, second_id_pair)
 
 
-def main():
-    lines = yield_data(FILENAME)
-    print(
-        sum(
-            assignemnt_pair.one_pair_fully_contains_other()
-            for assignemnt_pair in create_assignment_pairs(lines)
+@dataclasses.dataclass(frozen=True)
+class IndexedIdPair:
+    assignment_index: int
+    id_pair: IdPair
+
+
+@dataclasses.dataclass
+class AssignmentIndex:
+    # Sorted by id_start and searched as an implicit balanced tree: the node
+    # for indexed_id_pairs[low:high] is the middle item, and max_id_ends holds
+    # the largest id_end in that node's range.
+    indexed_id_pairs: list[IndexedIdPair]
+    id_starts: list[int] = dataclasses.field(init=False)
+    id_ends: list[int] = dataclasses.field(init=False)
+    max_id_ends: list[int] = dataclasses.field(init=False)
+
+    def __post_init__(self):
+        self.indexed_id_pairs.sort(
+            key=lambda indexed_id_pair: (
+                indexed_id_pair.id_pair.id_start,
+                indexed_id_pair.id_pair.id_end,
+            )
         )
-    )
+        self.id_starts = [
+            indexed_id_pair.id_pair.id_start
+            for indexed_id_pair in self.indexed_id_pairs
+        ]
+        self.id_ends = [
+            indexed_id_pair.id_pair.id_end for indexed_id_pair in self.indexed_id_pairs
+        ]
+        self.max_id_ends = self.id_ends[:]
+        self.build_max_id_ends(0, len(self.indexed_id_pairs))
+
+    def build_max_id_ends(self, low: int, high: int) -> int:
+        middle = (low + high) // 2
+        if low < middle:
+            self.max_id_ends[middle] = max(
+                self.max_id_ends[middle], self.build_max_id_ends(low, middle)
+            )
+        if middle + 1 < high:
+            self.max_id_ends[middle] = max(
+                self.max_id_ends[middle], self.build_max_id_ends(middle + 1, high)
+            )
+        return self.max_id_ends[middle] if low < high else -1
+
+    def search(
+        self,
+        low: int,
+        high: int,
+        max_id_start: int,
+        min_id_end: int,
+        found: list[IndexedIdPair],
+    ) -> None:
+        if low >= high:
+            return
+        middle = (low + high) // 2
+        if self.max_id_ends[middle] < min_id_end:
+            return
+        self.search(low, middle, max_id_start, min_id_end, found)
+        if self.id_starts[middle] > max_id_start:
+            return
+        if self.id_ends[middle] >= min_id_end:
+            found.append(self.indexed_id_pairs[middle])
+        self.search(middle + 1, high, max_id_start, min_id_end, found)
+
+    def overlapping(self, id_pair: IdPair) -> list[IndexedIdPair]:
+        found: list[IndexedIdPair] = []
+        self.search(
+            0, len(self.indexed_id_pairs), id_pair.id_end, id_pair.id_start, found
+        )
+        return found
 
-    lines = yield_data(FILENAME)
-    print(
-        sum(
-            assignemnt_pair.one_pair_overlaps_other()
-            for assignemnt_pair in create_assignment_pairs(lines)
+    def containing(self, id_pair: IdPair) -> list[IndexedIdPair]:
+        found: list[IndexedIdPair] = []
+        self.search(
+            0, len(self.indexed_id_pairs), id_pair.id_start, id_pair.id_end, found
+        )
+        return found
+
+    def contained_by(self, id_pair: IdPair) -> list[IndexedIdPair]:
+        low = bisect.bisect_left(self.id_starts, id_pair.id_start)
+        high = bisect.bisect_right(self.id_starts, id_pair.id_end)
+        return [
+            self.indexed_id_pairs[index]
+            for index in range(low, high)
+            if self.id_ends[index] <= id_pair.id_end
+        ]
+
+    def count_overlapping_any_other(self) -> int:
+        # Sorted by id_start, a pair overlaps an earlier one if any earlier
+        # id_end reaches it, and a later one if the next id_start is in range.
+        count = 0
+        max_previous_id_end = None
+        for index, (id_start, id_end) in enumerate(zip(self.id_starts, self.id_ends)):
+            overlaps_previous = (
+                max_previous_id_end is not None and max_previous_id_end >= id_start
+            )
+            overlaps_next = (
+                index + 1 < len(self.id_starts) and self.id_starts[index + 1] <= id_end
+            )
+            if overlaps_previous or overlaps_next:
+                count += 1
+            if max_previous_id_end is None or id_end > max_previous_id_end:
+                max_previous_id_end = id_end
+        return count
+
+
+def create_assignment_index(
+    assignment_pairs: Iterator[AssignmentIdPairs],
+) -> AssignmentIndex:
+    indexed_id_pairs: list[IndexedIdPair] = []
+    for assignment_index, assignment_pair in enumerate(assignment_pairs):
+        indexed_id_pairs.append(
+            IndexedIdPair(assignment_index, assignment_pair.first_id_pair)
+        )
+        indexed_id_pairs.append(
+            IndexedIdPair(assignment_index, assignment_pair.second_id_pair)
+        )
+    return AssignmentIndex(indexed_id_pairs)
+
+
+def count_contains_and_overlaps(lines: Iterator[str]) -> tuple[int, int]:
+    fully_contains_count = 0
+    overlaps_count = 0
+    for line in lines:
+        first_start, first_end, second_start, second_end = map(
+            int, line.replace(",", "-").split("-")
         )
+        if (first_start <= second_start and first_end >= second_end) or (
+            second_start <= first_start and second_end >= first_end
+        ):
+            fully_contains_count += 1
+        if first_start <= second_end and first_end >= second_start:
+            overlaps_count += 1
+    return fully_contains_count, overlaps_count
+
+
+def create_assignment_ids_array(filename: str) -> "np.ndarray":
+    require_numpy()
+    data = map_file(filename)
+    # Each row takes at least MIN_ROW_SIZE bytes, and pages past the rows
+    # actually filled are never touched. Blocks end on a line break, so each
+    # holds whole rows of four ids.
+    assignment_ids = np.empty(4 * (len(data) // MIN_ROW_SIZE + 1), dtype=np.int32)
+    size = 0
+    for block in yield_line_blocks(data):
+        block_ids = np.fromstring(
+            block.translate(ID_SEPARATORS), dtype=np.int32, sep=" "
+        )
+        assignment_ids[size : size + block_ids.size] = block_ids
+        size += block_ids.size
+    return assignment_ids[:size].reshape(-1, 4)
+
+
+def count_contains_and_overlaps_array(
+    assignment_ids: "np.ndarray",
+) -> tuple[int, int]:
+    first_start, first_end, second_start, second_end = assignment_ids.T
+    fully_contains = ((first_start <= second_start) & (first_end >= second_end)) | (
+        (second_start <= first_start) & (second_end >= first_end)
+    )
+    overlaps = (first_start <= second_end) & (first_end >= second_start)
+    return int(np.count_nonzero(fully_contains)), int(np.count_nonzero(overlaps))
+
+
+def part1(filename: str, use_numpy: bool = False) -> int:
+    if use_numpy:
+        assignment_ids = create_assignment_ids_array(filename)
+        return count_contains_and_overlaps_array(assignment_ids)[0]
+    lines = yield_data(filename)
+    return count_contains_and_overlaps(lines)[0]
+
+
+def part2(filename: str, use_numpy: bool = False) -> int:
+    if use_numpy:
+        assignment_ids = create_assignment_ids_array(filename)
+        return count_contains_and_overlaps_array(assignment_ids)[1]
+    lines = yield_data(filename)
+    return count_contains_and_overlaps(lines)[1]
+
+
+def main():
+    fully_contains_count, overlaps_count = count_contains_and_overlaps(
+        yield_data(FILENAME)
     )
+    print(fully_contains_count)
+    print(overlaps_count)
 
 
 if __name__ == "__main__":
@@ -1,25 +1,16 @@
+import array
 import dataclasses
 import typing
 import itertools
-import collections
 import re
 
-FILENAME = "day5_data.txt"
-
-
-def yield_data(filename: str) -> typing.Iterator[str]:
-    with open(file=filename, mode="r") as read_file:
-        for line in read_file:
-            yield line.rstrip()
+from puzzle_input import Buffer, map_file
 
+FILENAME = "day5_data.txt"
 
-def grouper(
-    iterable: typing.Iterable, n: int, fillvalue=None
-):  # from itertools recipes
-    "Collect data into non-overlapping fixed-length chunks or blocks"
-    # grouper('ABCDEFG', 3, 'x') --> ABC DEF Gxx
-    args = [iter(iterable)] * n
-    return itertools.zip_longest(*args, fillvalue=fillvalue)
+PROCEDURE_PATTERN = re.compile("move (\\d+) from (\\d+) to (\\d+)")
+PROCEDURE_BYTES_PATTERN = re.compile(b"move (\\d+) from (\\d+) to (\\d+)")
+BLANK_LINE_PATTERN = re.compile(b"\r?\n\r?\n")
 
 
 @dataclasses.dataclass
@@ -29,49 +20,73 @@ class RearrangementProcedure:
     to_stack: int
 
 
-class CrateStacks(typing.DefaultDict[int, collections.deque]):
+class CrateStacks(typing.DefaultDict[int, list[str]]):
     def __init__(self):
-        super().__init__(collections.deque)
+        super().__init__(list)
 
     def move_crate(self, from_stack: int, to_stack: int) -> None:
         self[to_stack].append(self[from_stack].pop())
 
+    def move_crates(
+        self, qty: int, from_stack: int, to_stack: int, multiple: bool = False
+    ) -> None:
+        # Moved as one slice; crates moved one at a time end up reversed.
+        from_crates = self[from_stack]
+        block_start = len(from_crates) - qty
+        if block_start < 0:
+            raise IndexError(f"Stack {from_stack} has fewer than {qty} crates")
+        if from_stack == to_stack:  # crates put back on their own stack stay put
+            return
+        move_crates = from_crates[block_start:]
+        del from_crates[block_start:]
+        if multiple:
+            self[to_stack].extend(move_crates)
+        else:
+            self[to_stack].extend(reversed(move_crates))
+
     def procedure_move(self, rearrangement_procedure: RearrangementProcedure) -> None:
-        for _ in range(rearrangement_procedure.qty):
-            self.move_crate(
-                rearrangement_procedure.from_stack, rearrangement_procedure.to_stack
-            )
+        self.move_crates(
+            rearrangement_procedure.qty,
+            rearrangement_procedure.from_stack,
+            rearrangement_procedure.to_stack,
+        )
 
     def procedure_move_multiple(
         self, rearrangement_procedure: RearrangementProcedure
     ) -> None:
-        move_crates = collections.deque()
-        for _ in range(rearrangement_procedure.qty):
-            move_crates.append(self[rearrangement_procedure.from_stack].pop())
-        for crate in reversed(move_crates):
-            self[rearrangement_procedure.to_stack].append(crate)
+        self.move_crates(
+            rearrangement_procedure.qty,
+            rearrangement_procedure.from_stack,
+            rearrangement_procedure.to_stack,
+            multiple=True,
+        )
 
     def crates_on_top_stacks(self) -> str:
         return "".join(self[stack_index][-1] for stack_index in range(1, len(self) + 1))
 
 
 def yield_crates(line: str) -> typing.Iterator[str]:
-    for group in grouper(line, 4):  # type: ignore
-        group: tuple[str, str, str, typing.Optional[str]]
-        yield group[1]
+    # Crate letters sit in every fourth column: "[A] [B]     [D]".
+    return iter(line[1::4])
 
 
 def create_crate_stacks(lines: typing.Iterator[str]) -> CrateStacks:
     crate_stacks = CrateStacks()
     for line in lines:
         if not "[" in line:
+            # The number row lists every stack, including any drawn empty.
+            for stack_index in map(int, line.split()):
+                crate_stacks.setdefault(stack_index, [])
             break
         for index, string in enumerate(yield_crates(line), 1):
             if string == " ":
                 continue
-            crate_stacks[index].appendleft(string)
+            crate_stacks[index].append(string)
 
-    _ = next(lines)
+    # The drawing lists crates top first, stacks are kept bottom first.
+    for crates in crate_stacks.values():
+        crates.reverse()
+    _ = next(lines, None)
     return crate_stacks
 
 
@@ -79,30 +94,87 @@ def create_rearrangment_procedures(
     lines: typing.Iterator[str],
 ) -> typing.Iterator[RearrangementProcedure]:
     for line in lines:
-        search = re.search("move (\\d+) from (\\d+) to (\\d+)", line)
+        search = PROCEDURE_PATTERN.search(line)
         if search:
             yield RearrangementProcedure(*(int(value) for value in search.groups()))
 
 
-def part1(filename: str) -> None:
-    lines = yield_data(filename)
-    crate_stacks = create_crate_stacks(lines)
-    for rearrangement_procedure in create_rearrangment_procedures(lines):
-        crate_stacks.procedure_move(rearrangement_procedure)
-    print(crate_stacks.crates_on_top_stacks())
-
-
-def part2(filename: str) -> None:
-    lines = yield_data(filename)
-    crate_stacks = create_crate_stacks(lines)
-    for rearrangement_procedure in create_rearrangment_procedures(lines):
-        crate_stacks.procedure_move_multiple(rearrangement_procedure)
-    print(crate_stacks.crates_on_top_stacks())
+def create_procedure_array(data: Buffer, pos: int = 0) -> array.array:
+    # Flat qty, from_stack, to_stack triples.
+    searches = PROCEDURE_BYTES_PATTERN.finditer(data, pos)
+    procedure_values = itertools.chain.from_iterable(
+        search.groups() for search in searches
+    )
+    return array.array("i", map(int, procedure_values))
+
+
+def yield_procedure_triples(
+    procedure_array: array.array,
+) -> typing.Iterator[tuple[int, int, int]]:
+    procedure_values = iter(procedure_array)
+    return zip(procedure_values, procedure_values, procedure_values)
+
+
+def parse_crate_file(filename: str) -> tuple[CrateStacks, array.array]:
+    data = map_file(filename)
+    blank_line = BLANK_LINE_PATTERN.search(data)
+    drawing_end = blank_line.start() if blank_line else len(data)
+    drawing_lines = data[:drawing_end].decode().splitlines()
+    crate_stacks = create_crate_stacks(iter(drawing_lines))
+    return crate_stacks, create_procedure_array(data, drawing_end)
+
+
+def crates_on_top_after_procedures(
+    crate_stacks: CrateStacks,
+    procedure_array: array.array,
+    multiple: bool = False,
+) -> str:
+    # Trace where each final top crate was before every procedure, working
+    # backwards, instead of moving any crates. Depth counts from the top.
+    positions = [(stack_index, 0) for stack_index in range(1, len(crate_stacks) + 1)]
+    for qty, from_stack, to_stack in zip(
+        procedure_array[-3::-3], procedure_array[-2::-3], procedure_array[-1::-3]
+    ):
+        if from_stack == to_stack:
+            continue
+        for index, (stack_index, depth) in enumerate(positions):
+            if stack_index == to_stack:
+                if depth < qty:
+                    stack_index = from_stack
+                    depth = depth if multiple else qty - 1 - depth
+                else:
+                    depth -= qty
+            elif stack_index == from_stack:
+                depth += qty
+            positions[index] = (stack_index, depth)
+    return "".join(
+        crate_stacks[stack_index][-1 - depth] for stack_index, depth in positions
+    )
+
+
+def part1(filename: str, lazy: bool = False) -> str:
+    crate_stacks, procedure_array = parse_crate_file(filename)
+    if lazy:
+        return crates_on_top_after_procedures(crate_stacks, procedure_array)
+    for qty, from_stack, to_stack in yield_procedure_triples(procedure_array):
+        crate_stacks.move_crates(qty, from_stack, to_stack)
+    return crate_stacks.crates_on_top_stacks()
+
+
+def part2(filename: str, lazy: bool = False) -> str:
+    crate_stacks, procedure_array = parse_crate_file(filename)
+    if lazy:
+        return crates_on_top_after_procedures(
+            crate_stacks, procedure_array, multiple=True
+        )
+    for qty, from_stack, to_stack in yield_procedure_triples(procedure_array):
+        crate_stacks.move_crates(qty, from_stack, to_stack, multiple=True)
+    return crate_stacks.crates_on_top_stacks()
 
 
 def main():
-    part1(FILENAME)
-    part2(FILENAME)
+    print(part1(FILENAME))
+    print(part2(FILENAME))
 
 
 if __name__ == "__main__":
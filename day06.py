@@ -1,48 +1,172 @@
-import collections
-import itertools
+import dataclasses
 import typing
 
+from puzzle_input import np, require_numpy
+
 FILENAME = "day6_data.txt"
 
+CHUNK_SIZE = 1 << 16
 
-def yield_data(filename: str) -> typing.Iterator[str]:
-    with open(file=filename, mode="r") as read_file:
-        for line in read_file:
-            yield line.rstrip()
 
+def create_last_seen() -> list[int]:
+    return [-1] * 256
 
-def sliding_window(iterable: typing.Iterable, n: int):  # from itertools recipes
-    # sliding_window('ABCDEFG', 4) -> ABCD BCDE CDEF DEFG
-    it = iter(iterable)
-    window = collections.deque(itertools.islice(it, n), maxlen=n)
-    if len(window) == n:
-        yield tuple(window)
-    for x in it:
-        window.append(x)
-        yield tuple(window)
 
+def check_window_sizes(window_sizes: typing.Iterable[int]) -> tuple[int, ...]:
+    window_sizes = tuple(window_sizes)
+    for window_size in window_sizes:
+        if window_size < 1:
+            raise ValueError(f"window_size must be at least 1, not {window_size}")
+    return window_sizes
 
-def part1(filename: str) -> None:
-    lines = yield_data(filename)
-    line = next(lines)
-    for index, item in enumerate(sliding_window(line, 4), 4):
-        if len(set(item)) == 4:
-            print(index)
-            break
+
+@dataclasses.dataclass
+class MarkerDetector:
+    window_sizes: typing.Iterable[int]
+    markers: dict[int, typing.Optional[int]] = dataclasses.field(init=False)
+    pending_window_sizes: list[int] = dataclasses.field(init=False, repr=False)
+    position: int = dataclasses.field(default=0, init=False)
+    window_start: int = dataclasses.field(default=0, init=False)
+    last_seen: list[int] = dataclasses.field(
+        default_factory=create_last_seen, init=False, repr=False
+    )
+
+    def __post_init__(self):
+        self.window_sizes = check_window_sizes(self.window_sizes)
+        self.markers = dict.fromkeys(self.window_sizes)
+        # Largest first so the next size to reach is popped off the end.
+        self.pending_window_sizes = sorted(set(self.window_sizes), reverse=True)
+
+    @property
+    def is_complete(self) -> bool:
+        return not self.pending_window_sizes
+
+    def feed(self, chunk: bytes) -> bool:
+        # Track where each byte was last seen; a repeat inside the window moves
+        # the window start past it, so every byte is visited once. The run of
+        # distinct bytes ending at each index is shared by every window size,
+        # and indexes are absolute so the run carries over between chunks.
+        if self.is_complete:
+            return True
+        last_seen = self.last_seen
+        window_start = self.window_start
+        pending_window_sizes = self.pending_window_sizes
+        next_window_size = pending_window_sizes[-1]
+        for index, character in enumerate(chunk, self.position):
+            if last_seen[character] >= window_start:
+                window_start = last_seen[character] + 1
+            last_seen[character] = index
+            if index - window_start + 1 >= next_window_size:
+                while (
+                    pending_window_sizes
+                    and index - window_start + 1 >= pending_window_sizes[-1]
+                ):
+                    self.markers[pending_window_sizes.pop()] = index + 1
+                if not pending_window_sizes:
+                    break
+                next_window_size = pending_window_sizes[-1]
+        self.position += len(chunk)
+        self.window_start = window_start
+        return self.is_complete
+
+
+def find_markers(
+    datastream: bytes, window_sizes: typing.Iterable[int]
+) -> dict[int, typing.Optional[int]]:
+    marker_detector = MarkerDetector(window_sizes)
+    marker_detector.feed(datastream)
+    return marker_detector.markers
+
+
+def find_marker(datastream: bytes, window_size: int) -> typing.Optional[int]:
+    return find_markers(datastream, (window_size,))[window_size]
 
 
-def part2(filename: str) -> None:
-    lines = yield_data(filename)
-    line = next(lines)
-    for index, item in enumerate(sliding_window(line, 14), 14):
-        if len(set(item)) == 14:
-            print(index)
+def yield_datastream_chunks(
+    filename: str, chunk_size: int = CHUNK_SIZE
+) -> typing.Iterator[bytes]:
+    # Trailing \r is held back until the next chunk shows whether it is data
+    # or the start of a \r\n split across chunks; at the end of file it is
+    # dropped like any other line ending.
+    held_back = b""
+    with open(file=filename, mode="rb") as read_file:
+        while chunk := read_file.read(chunk_size):
+            if held_back:
+                chunk = held_back + chunk
+            line_end = chunk.find(b"\n")
+            if line_end != -1:
+                yield chunk[:line_end].rstrip(b"\r")
+                return
+            data = chunk.rstrip(b"\r")
+            held_back = chunk[len(data) :]
+            if data:
+                yield data
+
+
+def find_markers_in_file(
+    filename: str, window_sizes: typing.Iterable[int], chunk_size: int = CHUNK_SIZE
+) -> dict[int, typing.Optional[int]]:
+    marker_detector = MarkerDetector(window_sizes)
+    for chunk in yield_datastream_chunks(filename, chunk_size):
+        if marker_detector.feed(chunk):
             break
+    return marker_detector.markers
+
+
+def count_bits_array(values: "np.ndarray") -> "np.ndarray":
+    if hasattr(np, "bitwise_count"):  # NumPy 2.0+
+        return np.bitwise_count(values)
+    byte_bit_counts = np.array([bin(byte).count("1") for byte in range(256)])
+    return byte_bit_counts[values.view(np.uint8)].reshape(-1, 4).sum(axis=1)
+
+
+def find_markers_array(
+    datastream: typing.Union[bytes, memoryview], window_sizes: typing.Iterable[int]
+) -> dict[int, typing.Optional[int]]:
+    require_numpy()
+    window_sizes = check_window_sizes(window_sizes)
+    characters = np.frombuffer(datastream, dtype=np.uint8)
+    if characters.size and (characters.min() < ord("a") or characters.max() > ord("z")):
+        raise ValueError("The NumPy backend only handles datastreams of a-z")
+    # One bit per letter. XOR over a window keeps the letters seen an odd
+    # number of times, so only a window of distinct letters has window_size
+    # bits set. Window XORs come from differences of the running XOR.
+    letter_bits = np.left_shift(
+        np.uint32(1), (characters - ord("a")).astype(np.uint32)
+    )
+    running_xor = np.concatenate(
+        (np.zeros(1, dtype=np.uint32), np.bitwise_xor.accumulate(letter_bits))
+    )
+    markers: dict[int, typing.Optional[int]] = {}
+    for window_size in window_sizes:
+        markers[window_size] = None
+        if window_size > characters.size:
+            continue
+        window_xors = running_xor[window_size:] ^ running_xor[:-window_size]
+        window_starts = np.flatnonzero(count_bits_array(window_xors) == window_size)
+        if window_starts.size:
+            markers[window_size] = int(window_starts[0]) + window_size
+    return markers
+
+
+def part1(filename: str, use_numpy: bool = False) -> typing.Optional[int]:
+    if use_numpy:
+        datastream = b"".join(yield_datastream_chunks(filename))
+        return find_markers_array(datastream, (4,))[4]
+    return find_markers_in_file(filename, (4,))[4]
+
+
+def part2(filename: str, use_numpy: bool = False) -> typing.Optional[int]:
+    if use_numpy:
+        datastream = b"".join(yield_datastream_chunks(filename))
+        return find_markers_array(datastream, (14,))[14]
+    return find_markers_in_file(filename, (14,))[14]
 
 
 def main():
-    part1(FILENAME)
-    part2(FILENAME)
+    markers = find_markers_in_file(FILENAME, (4, 14))
+    print(markers[4])
+    print(markers[14])
 
 
 if __name__ == "__main__":
@@ -1,13 +1,15 @@
+import array
+import bisect
 import dataclasses
+import itertools
+import logging
 import typing
 
-FILENAME = "day7_data.txt"
+from puzzle_input import yield_lines as yield_data
 
+FILENAME = "day7_data.txt"
 
-def yield_data(filename: str) -> typing.Iterator[str]:
-    with open(file=filename, mode="r") as read_file:
-        for line in read_file:
-            yield line.rstrip()
+logger = logging.getLogger(__name__)
 
 
 @dataclasses.dataclass
@@ -16,34 +18,75 @@ class File:
     size: int
 
 
-@dataclasses.dataclass
+# Compared and hashed by identity: every node is distinct, and comparing fields
+# would recurse through parent_directory.
+@dataclasses.dataclass(eq=False)
 class Directory:
     name: str
     parent_directory: typing.Optional["Directory"] = None
-    directories: list["Directory"] = dataclasses.field(default_factory=list)
-    files: list[File] = dataclasses.field(default_factory=list)
+    # Children by name, in the order they were first listed.
+    directories: dict[str, "Directory"] = dataclasses.field(default_factory=dict)
+    files: dict[str, File] = dataclasses.field(default_factory=dict)
+    cached_total_size: typing.Optional[int] = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def add_directory(self, directory: "Directory") -> None:
+        if directory.name in self.directories:
+            return
         directory.parent_directory = self
-        self.directories.append(directory)
+        self.directories[directory.name] = directory
+        self.invalidate_total_size()
 
     def add_file(self, file: File) -> None:
-        self.files.append(file)
+        if file.name in self.files:
+            return
+        self.files[file.name] = file
+        self.invalidate_total_size()
+
+    def invalidate_total_size(self) -> None:
+        # Sizes are only cached bottom up, so once a directory has no cached
+        # size neither do any of its parents.
+        directory: typing.Optional[Directory] = self
+        while directory and directory.cached_total_size is not None:
+            directory.cached_total_size = None
+            directory = directory.parent_directory
+
+    def path(self) -> str:
+        names = []
+        directory = self
+        while directory.parent_directory:
+            names.append(directory.name)
+            directory = directory.parent_directory
+        return "/" + "/".join(reversed(names))
 
     def get_directory(self, name: str) -> typing.Optional["Directory"]:
-        for directory in self.directories:
-            if directory.name == name:
-                return directory
-        return None
+        return self.directories.get(name)
 
     def total_files_size(self) -> int:
-        return sum(file.size for file in self.files)
+        return sum(file.size for file in self.files.values())
 
     def total_size(self) -> int:
-        total = self.total_files_size()
-        for directory in self.directories:
-            total += directory.total_size()
-        return total
+        if self.cached_total_size is None:
+            self.calculate_total_sizes()
+        return typing.cast(int, self.cached_total_size)
+
+    def calculate_total_sizes(self) -> None:
+        # One post-order pass over the directories that have no cached size.
+        directories: list[tuple[Directory, bool]] = [(self, False)]
+        while directories:
+            directory, children_sized = directories.pop()
+            if children_sized:
+                directory.cached_total_size = directory.total_files_size() + sum(
+                    typing.cast(int, child_directory.cached_total_size)
+                    for child_directory in directory.directories.values()
+                )
+            elif directory.cached_total_size is None:
+                directories.append((directory, True))
+                directories.extend(
+                    (child_directory, False)
+                    for child_directory in directory.directories.values()
+                )
 
 
 def create_root_directory() -> Directory:
@@ -53,13 +96,16 @@ def create_root_directory() -> Directory:
 @dataclasses.dataclass
 class FileSystem:
     directory: Directory = dataclasses.field(default_factory=create_root_directory)
+    root_directory: Directory = dataclasses.field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.root_directory = self.directory
+        while self.root_directory.parent_directory:
+            self.root_directory = self.root_directory.parent_directory
 
     def change_directory(self, command: str, create_if_not_exist: bool = True) -> None:
         if command == "/":
-            while True:
-                if not self.directory.parent_directory:
-                    break
-                self.directory = self.directory.parent_directory
+            self.directory = self.root_directory
         elif command == "..":
             if not self.directory.parent_directory:
                 return
@@ -69,100 +115,547 @@ class FileSystem:
             if directory:
                 self.directory = directory
             elif not directory and create_if_not_exist:
-                print(f"In Change Directory, directory added: {command}")
+                logger.debug("In Change Directory, directory added: %s", command)
                 directory = Directory(command)
                 self.add_directory(directory)
                 self.directory = directory
             else:
-                print(f"No directoy named {command}")
+                logger.debug("No directoy named %s", command)
 
     def add_directory(self, directory: Directory) -> None:
         self.directory.add_directory(directory)
 
+    def name(self, directory: Directory) -> str:
+        return directory.name
+
+    def add_listed_directory(self, ls_directory: Directory, name: str) -> None:
+        ls_directory.add_directory(Directory(name))
+
+    def add_listed_file(self, ls_directory: Directory, name: str, size: int) -> None:
+        ls_directory.add_file(File(name, size))
+
     def directory_total_files_size(self) -> int:
         return self.directory.total_files_size()
 
     def directory_total_size(self) -> int:
         return self.directory.total_size()
 
+    def yield_directory_sizes(self) -> typing.Iterator[tuple[Directory, int]]:
+        for directory in walk_directories(self.root_directory):
+            yield directory, directory.total_size()
+
+
+SIZE_INDEX_BUCKET_SIZE = 512
+
+
+@dataclasses.dataclass
+class SizeIndex:
+    # Sorted entries split into buckets of at most twice SIZE_INDEX_BUCKET_SIZE,
+    # so an update shifts one small list instead of the whole index.
+    # bucket_maxes holds the last entry of each bucket for bisecting.
+    buckets: list[list[tuple[int, int]]] = dataclasses.field(default_factory=list)
+    bucket_maxes: list[tuple[int, int]] = dataclasses.field(default_factory=list)
+
+    def __len__(self) -> int:
+        return sum(map(len, self.buckets))
+
+    def __iter__(self) -> typing.Iterator[tuple[int, int]]:
+        for bucket in self.buckets:
+            yield from bucket
+
+    def __reversed__(self) -> typing.Iterator[tuple[int, int]]:
+        for bucket in reversed(self.buckets):
+            yield from reversed(bucket)
+
+    def add(self, entry: tuple[int, int]) -> None:
+        if not self.buckets:
+            self.buckets.append([entry])
+            self.bucket_maxes.append(entry)
+            return
+        index = bisect.bisect_left(self.bucket_maxes, entry)
+        if index == len(self.buckets):
+            index -= 1
+            self.buckets[index].append(entry)
+            self.bucket_maxes[index] = entry
+        else:
+            bisect.insort(self.buckets[index], entry)
+        bucket = self.buckets[index]
+        if len(bucket) > 2 * SIZE_INDEX_BUCKET_SIZE:
+            self.buckets.insert(index + 1, bucket[SIZE_INDEX_BUCKET_SIZE:])
+            del bucket[SIZE_INDEX_BUCKET_SIZE:]
+            self.bucket_maxes.insert(index, bucket[-1])
+
+    def remove(self, entry: tuple[int, int]) -> None:
+        index = bisect.bisect_left(self.bucket_maxes, entry)
+        bucket = self.buckets[index]
+        del bucket[bisect.bisect_left(bucket, entry)]
+        if bucket:
+            self.bucket_maxes[index] = bucket[-1]
+        else:
+            del self.buckets[index]
+            del self.bucket_maxes[index]
+
+    def irange(
+        self, low: tuple[int, ...], high: tuple[int, ...]
+    ) -> typing.Iterator[tuple[int, int]]:
+        # Entries from low up to, but not including, high.
+        index = bisect.bisect_left(self.bucket_maxes, low)
+        for bucket in itertools.islice(self.buckets, index, None):
+            for entry in bucket[bisect.bisect_left(bucket, low) :]:
+                if entry >= high:
+                    return
+                yield entry
+
+
+@dataclasses.dataclass
+class IndexedFileSystem(FileSystem):
+    # Every directory has a number, its position in indexed_directories, and a
+    # running size that each added file updates up the parent chain. The sorted
+    # (size, number) index only catches up with the directories changed since
+    # the last query, so appending lines never touches the index itself.
+    indexed_directories: list[Directory] = dataclasses.field(
+        default_factory=list, init=False, repr=False
+    )
+    directory_numbers: dict[Directory, int] = dataclasses.field(
+        default_factory=dict, init=False, repr=False
+    )
+    directory_sizes: list[int] = dataclasses.field(
+        default_factory=list, init=False, repr=False
+    )
+    indexed_sizes: list[typing.Optional[int]] = dataclasses.field(
+        default_factory=list, init=False, repr=False
+    )
+    size_index: SizeIndex = dataclasses.field(
+        default_factory=SizeIndex, init=False, repr=False
+    )
+    changed_directories: dict[Directory, None] = dataclasses.field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def __post_init__(self):
+        super().__post_init__()
+        self.register_directories(self.root_directory)
+
+    def register_directories(self, directory: Directory) -> None:
+        for child_directory in walk_directories(directory):
+            self.directory_numbers[child_directory] = len(self.indexed_directories)
+            self.indexed_directories.append(child_directory)
+            self.directory_sizes.append(child_directory.total_size())
+            self.indexed_sizes.append(None)
+            self.changed_directories[child_directory] = None
+
+    def add_size(self, directory: Directory, size: int) -> None:
+        ancestor: typing.Optional[Directory] = directory
+        while ancestor:
+            self.directory_sizes[self.directory_numbers[ancestor]] += size
+            self.changed_directories[ancestor] = None
+            ancestor = ancestor.parent_directory
+
+    def update_size_index(self) -> None:
+        for directory in self.changed_directories:
+            number = self.directory_numbers[directory]
+            old_size = self.indexed_sizes[number]
+            new_size = self.directory_sizes[number]
+            if new_size == old_size:
+                continue
+            if old_size is not None:
+                self.size_index.remove((old_size, number))
+            self.size_index.add((new_size, number))
+            self.indexed_sizes[number] = new_size
+        self.changed_directories.clear()
+
+    def add_child_directory(
+        self, parent_directory: Directory, directory: Directory
+    ) -> None:
+        if directory.name in parent_directory.directories:
+            return
+        parent_directory.add_directory(directory)
+        self.register_directories(directory)
+        if directory_size := directory.total_size():
+            self.add_size(parent_directory, directory_size)
+
+    def add_directory(self, directory: Directory) -> None:
+        self.add_child_directory(self.directory, directory)
+
+    def add_listed_directory(self, ls_directory: Directory, name: str) -> None:
+        self.add_child_directory(ls_directory, Directory(name))
+
+    def add_listed_file(self, ls_directory: Directory, name: str, size: int) -> None:
+        if name in ls_directory.files:
+            return
+        super().add_listed_file(ls_directory, name, size)
+        if size:
+            self.add_size(ls_directory, size)
+
+    def find_directory(self, path: str) -> Directory:
+        directory = self.root_directory
+        for name in filter(None, path.split("/")):
+            child_directory = directory.get_directory(name)
+            if child_directory is None:
+                raise KeyError(path)
+            directory = child_directory
+        return directory
+
+    def directory_size(self, path: str) -> int:
+        return self.directory_sizes[self.directory_numbers[self.find_directory(path)]]
+
+    def index_entries(
+        self, entries: typing.Iterable[tuple[int, int]]
+    ) -> list[tuple[str, int]]:
+        return [
+            (self.indexed_directories[number].path(), directory_size)
+            for directory_size, number in entries
+        ]
+
+    def largest_directories(self, count: int) -> list[tuple[str, int]]:
+        self.update_size_index()
+        return self.index_entries(
+            itertools.islice(reversed(self.size_index), max(count, 0))
+        )
+
+    def directories_in_size_range(
+        self, min_size: int, max_size: int
+    ) -> list[tuple[str, int]]:
+        self.update_size_index()
+        return self.index_entries(self.size_index.irange((min_size,), (max_size + 1,)))
+
+
+ROOT_ID = 0
+EMPTY_SLOT = -1
+INITIAL_CHILD_TABLE_SIZE = 8
+
+
+def create_child_table(size: int) -> array.array:
+    return array.array("q", [EMPTY_SLOT]) * size
+
+
+@dataclasses.dataclass
+class ArrayFileSystem:
+    # Nodes are ids into parallel arrays rather than objects. The root is id 0
+    # and a node is always created after its parent, so parent ids are lower.
+    # Names are slices of one bytes pool and are not interned: a dict from
+    # name to offset costs about 100 bytes per distinct name, far more than
+    # the repeats it saves unless each name is reused over a dozen times.
+    parent_ids: array.array = dataclasses.field(
+        default_factory=lambda: array.array("q", [-1])
+    )
+    name_offsets: array.array = dataclasses.field(
+        default_factory=lambda: array.array("q", [0])
+    )
+    name_lengths: array.array = dataclasses.field(
+        default_factory=lambda: array.array("I", [1])
+    )
+    sizes: array.array = dataclasses.field(
+        default_factory=lambda: array.array("q", [0])
+    )
+    is_directory: bytearray = dataclasses.field(
+        default_factory=lambda: bytearray(b"\x01")
+    )
+    name_pool: bytearray = dataclasses.field(
+        default_factory=lambda: bytearray(b"/"), repr=False
+    )
+    # Open-addressed hash table of child node ids keyed by (parent id, name),
+    # kept at most half full; a dict entry per node would cost far more.
+    child_table: array.array = dataclasses.field(
+        default_factory=lambda: create_child_table(INITIAL_CHILD_TABLE_SIZE),
+        repr=False,
+    )
+    directory: int = ROOT_ID
+    total_sizes: typing.Optional[array.array] = dataclasses.field(
+        default=None, init=False, repr=False
+    )
+
+    def name_bytes(self, node_id: int) -> bytearray:
+        name_offset = self.name_offsets[node_id]
+        return self.name_pool[name_offset : name_offset + self.name_lengths[node_id]]
+
+    def name(self, node_id: int) -> str:
+        return self.name_bytes(node_id).decode()
+
+    def find_child_slot(self, parent_id: int, name: bytes) -> tuple[int, int]:
+        # Linear probing from the hash of (parent id, name); returns the slot
+        # holding the child, or the empty slot it would be added to.
+        child_table = self.child_table
+        slot_mask = len(child_table) - 1
+        slot = hash((parent_id, name)) & slot_mask
+        while (node_id := child_table[slot]) != EMPTY_SLOT:
+            if (
+                self.parent_ids[node_id] == parent_id
+                and self.name_lengths[node_id] == len(name)
+                and self.name_bytes(node_id) == name
+            ):
+                break
+            slot = (slot + 1) & slot_mask
+        return slot, node_id
+
+    def grow_child_table(self) -> None:
+        self.child_table = create_child_table(len(self.child_table) * 2)
+        for node_id in range(ROOT_ID + 1, len(self.parent_ids)):
+            slot, _ = self.find_child_slot(
+                self.parent_ids[node_id], bytes(self.name_bytes(node_id))
+            )
+            self.child_table[slot] = node_id
+
+    def get_child(self, parent_id: int, name: str) -> typing.Optional[int]:
+        _, node_id = self.find_child_slot(parent_id, name.encode())
+        return None if node_id == EMPTY_SLOT else node_id
+
+    def add_node(self, parent_id: int, name: str, size: int, is_directory: bool) -> int:
+        encoded_name = name.encode()
+        slot, node_id = self.find_child_slot(parent_id, encoded_name)
+        if node_id != EMPTY_SLOT:
+            return node_id
+        node_id = len(self.parent_ids)
+        self.parent_ids.append(parent_id)
+        self.name_offsets.append(len(self.name_pool))
+        self.name_lengths.append(len(encoded_name))
+        self.name_pool += encoded_name
+        self.sizes.append(size)
+        self.is_directory.append(is_directory)
+        self.child_table[slot] = node_id
+        if 2 * node_id >= len(self.child_table):
+            self.grow_child_table()
+        self.total_sizes = None
+        return node_id
+
+    def change_directory(self, command: str, create_if_not_exist: bool = True) -> None:
+        if command == "/":
+            self.directory = ROOT_ID
+        elif command == "..":
+            if self.directory != ROOT_ID:
+                self.directory = self.parent_ids[self.directory]
+        else:
+            directory_id = self.get_child(self.directory, command)
+            if directory_id is not None and self.is_directory[directory_id]:
+                self.directory = directory_id
+            elif directory_id is None and create_if_not_exist:
+                logger.debug("In Change Directory, directory added: %s", command)
+                self.directory = self.add_node(self.directory, command, 0, True)
+            else:
+                logger.debug("No directoy named %s", command)
+
+    def add_listed_directory(self, ls_directory: int, name: str) -> None:
+        self.add_node(ls_directory, name, 0, True)
+
+    def add_listed_file(self, ls_directory: int, name: str, size: int) -> None:
+        self.add_node(ls_directory, name, size, False)
+
+    def calculate_total_sizes(self) -> array.array:
+        # Children have higher ids than their parents, so one pass from the
+        # last id down adds every subtree into its parent before it is read.
+        total_sizes = array.array("q", self.sizes)
+        parent_ids = self.parent_ids
+        for node_id in range(len(total_sizes) - 1, ROOT_ID, -1):
+            total_sizes[parent_ids[node_id]] += total_sizes[node_id]
+        self.total_sizes = total_sizes
+        return total_sizes
+
+    def total_size(self, node_id: int) -> int:
+        total_sizes = self.total_sizes or self.calculate_total_sizes()
+        return total_sizes[node_id]
+
+    def directory_total_size(self) -> int:
+        return self.total_size(self.directory)
+
+    def walk_directories(self) -> typing.Iterator[int]:
+        for node_id, is_directory in enumerate(self.is_directory):
+            if is_directory:
+                yield node_id
+
+    def yield_directory_sizes(self) -> typing.Iterator[tuple[int, int]]:
+        total_sizes = self.total_sizes or self.calculate_total_sizes()
+        for directory_id in self.walk_directories():
+            yield directory_id, total_sizes[directory_id]
+
+
+AnyFileSystem = typing.Union[FileSystem, ArrayFileSystem]
+
 
 def parse_list_line(
-    line: str, file_system: FileSystem, ls_directory: Directory
+    line: str, file_system: AnyFileSystem, ls_directory: typing.Union[Directory, int]
 ) -> None:
+    # Looking up the listed directory's name isn't free, so only do it when
+    # the message will be logged.
+    debug = logger.isEnabledFor(logging.DEBUG)
     if line.startswith("dir"):
         _, directory_name = line.split(" ")
-        print(f"List add directory: {directory_name} added to {ls_directory.name}")
-        directory = Directory(directory_name)
-        file_system.add_directory(directory)
+        if debug:
+            logger.debug(
+                "List add directory: %s added to %s",
+                directory_name,
+                file_system.name(ls_directory),
+            )
+        file_system.add_listed_directory(ls_directory, directory_name)
         return None
 
     file_size, file_name = line.split(" ")
-    print(f"List add file: {file_name}, {file_size} to {ls_directory.name}")
-    file = File(file_name, int(file_size))
-    ls_directory.add_file(file)
+    if debug:
+        logger.debug(
+            "List add file: %s, %s to %s",
+            file_name,
+            file_size,
+            file_system.name(ls_directory),
+        )
+    file_system.add_listed_file(ls_directory, file_name, int(file_size))
     return None
 
 
+@dataclasses.dataclass
+class TerminalOutputParser:
+    # Keeps the directory being listed between feeds, so a transcript can be
+    # parsed as it grows.
+    file_system: AnyFileSystem
+    ls_directory: typing.Union[Directory, int, None] = None
+
+    def feed(self, terminal_output: typing.Iterable[str]) -> None:
+        file_system = self.file_system
+        ls_directory = self.ls_directory
+        for line in terminal_output:
+            if line.startswith("$ cd"):
+                _, _, command = line.split(" ")
+                logger.debug("Change Directory: %s", command)
+                file_system.change_directory(command)
+                ls_directory = None
+            elif line.startswith("$ ls"):
+                ls_directory = file_system.directory
+            elif ls_directory is not None:
+                parse_list_line(line, file_system, ls_directory)
+        self.ls_directory = ls_directory
+
+
 def parse_terminal_output(
-    terminal_output: typing.Iterator[str], file_system: FileSystem
+    terminal_output: typing.Iterator[str], file_system: AnyFileSystem
 ):
-    ls_directory = None
+    TerminalOutputParser(file_system).feed(terminal_output)
+
+
+def walk_directories(directory: Directory) -> typing.Iterator[Directory]:
+    # Pre-order with an explicit stack, so deep trees can't hit the recursion
+    # limit; children are pushed reversed to come off in listing order.
+    directories = [directory]
+    while directories:
+        directory = directories.pop()
+        yield directory
+        directories.extend(reversed(directory.directories.values()))
+
+
+def yield_streamed_directory_sizes(
+    terminal_output: typing.Iterator[str],
+) -> typing.Iterator[int]:
+    # Running sizes of the directories from the root down to the current one.
+    # A directory is added to its parent and yielded when it is first left,
+    # listed or not; later visits yield nothing, and listing a directory again
+    # adds nothing. Directories are numbered by (parent number, name) to tell
+    # them apart. The root is yielded last. Each directory's contents are
+    # assumed to be listed before it is first left, as in the puzzle
+    # transcripts.
+    directory_numbers: dict[tuple[int, str], int] = {}
+    listed_directories: set[int] = set()
+    directory_path = [ROOT_ID]
+    directory_sizes = [0]
+    first_visits = [True]
+    new_listing = False
     for line in terminal_output:
         if line.startswith("$ cd"):
             _, _, command = line.split(" ")
-            print(f"Change Directory: {command}")
-            file_system.change_directory(command)
-            ls_directory = None
+            if command == "/" or command == "..":
+                while len(directory_sizes) > 1:
+                    directory_path.pop()
+                    directory_size = directory_sizes.pop()
+                    directory_sizes[-1] += directory_size
+                    if first_visits.pop():
+                        yield directory_size
+                    if command == "..":
+                        break
+            else:
+                directory_key = (directory_path[-1], command)
+                directory_number = directory_numbers.get(directory_key)
+                first_visits.append(directory_number is None)
+                if directory_number is None:
+                    directory_number = len(directory_numbers) + 1
+                    directory_numbers[directory_key] = directory_number
+                directory_path.append(directory_number)
+                directory_sizes.append(0)
         elif line.startswith("$ ls"):
-            ls_directory = file_system.directory
-        elif ls_directory:
-            parse_list_line(line, file_system, ls_directory)
-
-
-def walk_directories(directory: Directory):
-    yield directory
-    for child_directory in directory.directories:
-        yield from walk_directories(child_directory)
-
-
-def part1(filename: str) -> None:
-    lines = yield_data(filename)
-    file_system = FileSystem()
-    parse_terminal_output(lines, file_system)
+            new_listing = directory_path[-1] not in listed_directories
+            listed_directories.add(directory_path[-1])
+        elif new_listing and line[:1].isdigit():
+            directory_sizes[-1] += int(line.split(" ", 1)[0])
+    while len(directory_sizes) > 1:
+        directory_size = directory_sizes.pop()
+        directory_sizes[-1] += directory_size
+        if first_visits.pop():
+            yield directory_size
+    yield directory_sizes[0]
+
+
+def create_file_system(filename: str, compact: bool = False) -> AnyFileSystem:
+    file_system: AnyFileSystem = ArrayFileSystem() if compact else FileSystem()
+    parse_terminal_output(yield_data(filename), file_system)
     file_system.change_directory("/")
+    return file_system
+
+
+def part1(filename: str, compact: bool = False, streaming: bool = False) -> int:
+    if streaming:
+        directory_sizes = yield_streamed_directory_sizes(yield_data(filename))
+        return sum(
+            directory_size
+            for directory_size in directory_sizes
+            if directory_size < 100000
+        )
+    file_system = create_file_system(filename, compact)
     total_sizes = 0
-    for directory in walk_directories(file_system.directory):
-        directory_total_size = directory.total_size()
-        print(f"Dir: {directory.name}, Size: {directory_total_size}")
+    debug = logger.isEnabledFor(logging.DEBUG)
+    for directory, directory_total_size in file_system.yield_directory_sizes():
+        if debug:
+            logger.debug(
+                "Dir: %s, Size: %s", file_system.name(directory), directory_total_size
+            )
         if directory_total_size < 100000:
             total_sizes += directory_total_size
-    print(total_sizes)
+    return total_sizes
 
 
-def part2(filename: str) -> None:
-    lines = yield_data(filename)
-    file_system = FileSystem()
-    parse_terminal_output(lines, file_system)
-    file_system.change_directory("/")
-    outermost_size = file_system.directory_total_size()
+def part2(filename: str, compact: bool = False, streaming: bool = False) -> int:
     TOTAL_DISK_SPACE = 70000000
     REQUIRED_UNUSED_SPACE = 30000000
+    if streaming:
+        # The threshold needs the root's size, which is only known at the
+        # end, so the streamed sizes are kept; the root's comes last.
+        directory_sizes = array.array(
+            "q", yield_streamed_directory_sizes(yield_data(filename))
+        )
+        unused_space = TOTAL_DISK_SPACE - directory_sizes[-1]
+        required_extra_unused_space = REQUIRED_UNUSED_SPACE - unused_space
+        return min(
+            directory_size
+            for directory_size in directory_sizes
+            if directory_size >= required_extra_unused_space
+        )
+    file_system = create_file_system(filename, compact)
+    outermost_size = file_system.directory_total_size()
     unused_space = TOTAL_DISK_SPACE - outermost_size
     required_extra_unused_space = REQUIRED_UNUSED_SPACE - unused_space
     smallest_directory = file_system.directory
-    for directory in walk_directories(file_system.directory):
-        directory_total_size = directory.total_size()
+    smallest_directory_size = outermost_size
+    for directory, directory_total_size in file_system.yield_directory_sizes():
         if directory_total_size < required_extra_unused_space:
             continue
-        if directory_total_size < smallest_directory.total_size():
+        if directory_total_size < smallest_directory_size:
             smallest_directory = directory
+            smallest_directory_size = directory_total_size
 
-    print(f"Dir: {smallest_directory.name}, Size: {smallest_directory.total_size()}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Smallest dir to delete: %s", file_system.name(smallest_directory)
+        )
+    return smallest_directory_size
 
 
 def main():
-    part1(FILENAME)
-    part2(FILENAME)
+    print(part1(FILENAME))
+    print(part2(FILENAME))
 
 
 if __name__ == "__main__":
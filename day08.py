@@ -1,13 +1,9 @@
 import dataclasses
 import typing
 
-FILENAME = "day8_data.txt"
-
+from puzzle_input import yield_lines
 
-def yield_lines(filename: str) -> typing.Iterator[str]:
-    with open(file=filename, mode="r") as read_file:
-        for line in read_file:
-            yield line.rstrip()
+FILENAME = "day8_data.txt"
 
 
 @dataclasses.dataclass
@@ -161,23 +157,23 @@ def create_grid(lines: typing.Iterator[str]) -> Grid:
     return grid
 
 
-def part1(filename: str) -> None:
+def part1(filename: str) -> int:
     lines = yield_lines(filename)
     grid = create_grid(lines)
     grid.find_trees_visible_all_directions()
-    print(grid.tress_visible)
+    return grid.tress_visible
 
 
-def part2(filename: str) -> None:
+def part2(filename: str) -> int:
     lines = yield_lines(filename)
     grid = create_grid(lines)
     grid.find_scenic_scores()
-    print(grid.max_scenic_score)
+    return grid.max_scenic_score
 
 
 def main():
-    part1(FILENAME)
-    part2(FILENAME)
+    print(part1(FILENAME))
+    print(part2(FILENAME))
 
 
 if __name__ == "__main__":
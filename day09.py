@@ -2,13 +2,9 @@ import dataclasses
 import enum
 import typing
 
-FILENAME = "day9_data.txt"
-
+from puzzle_input import yield_lines
 
-def yield_lines(filename: str) -> typing.Iterator[str]:
-    with open(file=filename, mode="r") as read_file:
-        for line in read_file:
-            yield line.rstrip()
+FILENAME = "day9_data.txt"
 
 
 @dataclasses.dataclass(frozen=True)
@@ -109,27 +105,27 @@ class Rope:
         return len(self.tail_visited_locations)
 
 
-def part1(filename: str) -> None:
+def part1(filename: str) -> int:
     lines = yield_lines(filename)
     location_directions = create_location_directions(lines)
     rope = Rope()
     for index, location_direction in enumerate(location_directions):
         rope.move_head_knot(location_direction)
-    print(rope.qty_positions_tail_visited())
+    return rope.qty_positions_tail_visited()
 
 
-def part2(filename: str) -> None:
+def part2(filename: str) -> int:
     lines = yield_lines(filename)
     location_directions = create_location_directions(lines)
     rope = Rope(10)
     for index, location_direction in enumerate(location_directions):
         rope.move_head_knot(location_direction)
-    print(rope.qty_positions_tail_visited())
+    return rope.qty_positions_tail_visited()
 
 
 def main():
-    part1(FILENAME)
-    part2(FILENAME)
+    print(part1(FILENAME))
+    print(part2(FILENAME))
 
 
 if __name__ == "__main__":
@@ -2,13 +2,9 @@ import dataclasses
 import enum
 import typing
 
-FILENAME = "day10_data.txt"
-
+from puzzle_input import yield_lines
 
-def yield_lines(filename: str) -> typing.Iterator[str]:
-    with open(file=filename, mode="r") as read_file:
-        for line in read_file:
-            yield line.rstrip()
+FILENAME = "day10_data.txt"
 
 
 class Command(enum.Enum):
@@ -146,7 +142,7 @@ class Crt:
             self.pixel = 0
 
 
-def part1(filename: str) -> None:
+def part1(filename: str) -> int:
     lines = yield_lines(filename)
     clock_circuit = ClockCircuit()
     cpu = Cpu(clock_circuit)
@@ -156,10 +152,10 @@ def part1(filename: str) -> None:
         while cpu.has_instructions:
             clock_circuit.cycle()
 
-    print(sum(cpu.signal_strengths))
+    return sum(cpu.signal_strengths)
 
 
-def part2(filename: str) -> None:
+def part2(filename: str) -> str:
     lines = yield_lines(filename)
     clock_circuit = ClockCircuit()
     cpu = Cpu(clock_circuit)
@@ -171,17 +167,15 @@ def part2(filename: str) -> None:
         while cpu.has_instructions:
             clock_circuit.cycle()
 
-    print("".join(crt.pixels[:40]))
-    print("".join(crt.pixels[40:80]))
-    print("".join(crt.pixels[80:120]))
-    print("".join(crt.pixels[120:160]))
-    print("".join(crt.pixels[160:200]))
-    print("".join(crt.pixels[200:240]))
+    return "\n".join(
+        "".join(crt.pixels[row_start : row_start + 40])
+        for row_start in range(0, 240, 40)
+    )
 
 
 def main():
-    part1(FILENAME)
-    part2(FILENAME)
+    print(part1(FILENAME))
+    print(part2(FILENAME))
 
 
 if __name__ == "__main__":
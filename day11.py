@@ -1,15 +1,14 @@
 import dataclasses
+import logging
 import math
 import operator
 import typing
 
-FILENAME = "day11_data.txt"
+from puzzle_input import yield_lines
 
+FILENAME = "day11_data.txt"
 
-def yield_lines(filename: str) -> typing.Iterator[str]:
-    with open(file=filename, mode="r") as read_file:
-        for line in read_file:
-            yield line.rstrip()
+logger = logging.getLogger(__name__)
 
 
 MonkeyId = int
@@ -142,19 +141,22 @@ class KeepAwayGame:
         return [monkey.inspected_item_count for monkey in self.monkeys]
 
 
-def part1(filename: str) -> None:
+def part1(filename: str) -> int:
     lines = yield_lines(filename)
     monkeys = create_monkeys(lines)
     keep_away_game = KeepAwayGame(monkeys)
     round = 0
     for round in range(20):
         keep_away_game.play_round()
-    print(
-        f"After round {round+1}, the monkeys are holding items with these worry levels:"
-    )
-    print(keep_away_game.monkey_items())
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "After round %s, the monkeys are holding items with these worry levels:"
+            "\n%s",
+            round + 1,
+            keep_away_game.monkey_items(),
+        )
     inspection_counts = sorted(keep_away_game.monkey_inspected_item_counts())
-    print(inspection_counts[-2] * inspection_counts[-1])
+    return inspection_counts[-2] * inspection_counts[-1]
 
 
 def part2(filename: str) -> None:
@@ -162,7 +164,7 @@ def part2(filename: str) -> None:
 
 
 def main():
-    part1(FILENAME)
+    print(part1(FILENAME))
     # part2(FILENAME)
 
 
@@ -3,13 +3,9 @@ import dataclasses
 import enum
 import typing
 
-FILENAME = "day12_data.txt"
-
+from puzzle_input import yield_lines
 
-def yield_lines(filename: str) -> typing.Iterator[str]:
-    with open(file=filename, mode="r") as read_file:
-        for line in read_file:
-            yield line.rstrip()
+FILENAME = "day12_data.txt"
 
 
 Grid = list[list[str]]
@@ -176,15 +172,16 @@ def find_shortest_path(
     return None
 
 
-def part1(filename: str) -> None:
+def part1(filename: str) -> typing.Optional[int]:
     lines = yield_lines(filename)
     heightmap = create_heightmap(lines)
     shortest_path = find_shortest_path(heightmap, heightmap.start_location)
     if shortest_path:
-        print(len(shortest_path) - 1)
+        return len(shortest_path) - 1
+    return None
 
 
-def part2(filename: str) -> None:
+def part2(filename: str) -> int:
     lines = yield_lines(filename)
     heightmap = create_heightmap(lines)
     start_locations = heightmap.letter_locations("a")
@@ -194,12 +191,12 @@ def part2(filename: str) -> None:
         shortest_path = find_shortest_path(heightmap, start_location)
         if shortest_path:
             shortest_paths.append(len(shortest_path) - 1)
-    print(min(shortest_paths))
+    return min(shortest_paths)
 
 
 def main():
-    part1(FILENAME)
-    part2(FILENAME)
+    print(part1(FILENAME))
+    print(part2(FILENAME))
 
 
 if __name__ == "__main__":
@@ -5,13 +5,9 @@ import itertools
 import operator
 import typing
 
-FILENAME = "day13_data.txt"
-
+from puzzle_input import yield_lines
 
-def yield_lines(filename: str) -> typing.Iterator[str]:
-    with open(file=filename, mode="r") as read_file:
-        for line in read_file:
-            yield line.rstrip()
+FILENAME = "day13_data.txt"
 
 
 def create_list_of_lists(line: str) -> list:
@@ -125,16 +121,16 @@ def compare_list_of_lists(left: list, right: list) -> int:
     return packet_pair.is_right_order()
 
 
-def part1(filename: str) -> None:
+def part1(filename: str) -> int:
     lines = yield_lines(filename)
     right_order_pairs_index = []
     for index, packet_pair in enumerate(create_packet_pairs(lines), 1):
         if packet_pair.is_right_order() == PacketOrderState.RIGHT:
             right_order_pairs_index.append(index)
-    print(sum(right_order_pairs_index))
+    return sum(right_order_pairs_index)
 
 
-def part2(filename: str) -> None:
+def part2(filename: str) -> int:
     lines = yield_lines(filename)
     list_of_lists = list(parse_list_of_lists(lines))
     divider_packets = [[[2]], [[6]]]
@@ -144,12 +140,12 @@ def part2(filename: str) -> None:
     for index, item in enumerate(list_of_lists, 1):
         if item in divider_packets:
             decoder_key_indexs.append(index)
-    print(operator.mul(*decoder_key_indexs))
+    return operator.mul(*decoder_key_indexs)
 
 
 def main():
-    part1(FILENAME)
-    part2(FILENAME)
+    print(part1(FILENAME))
+    print(part2(FILENAME))
 
 
 if __name__ == "__main__":
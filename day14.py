@@ -1,15 +1,14 @@
 import dataclasses
 import enum
 import itertools
+import logging
 import typing
 
-FILENAME = "day14_data.txt"
+from puzzle_input import yield_lines
 
+FILENAME = "day14_data.txt"
 
-def yield_lines(filename: str) -> typing.Iterator[str]:
-    with open(file=filename, mode="r") as read_file:
-        for line in read_file:
-            yield line.rstrip()
+logger = logging.getLogger(__name__)
 
 
 class LocationType(enum.Enum):
@@ -181,7 +180,7 @@ def add_unit_of_sand(cave_grid: Grid) -> Location:
             return sand_resting_location
 
 
-def part1(filename: str) -> None:
+def part1(filename: str) -> int:
     lines = yield_lines(filename)
     rock_grids = create_rock_grids(lines)
 
@@ -191,17 +190,19 @@ def part1(filename: str) -> None:
     for rock_grid in rock_grids:
         cave_grid.add_contained_grid(rock_grid)
     count = 0
+    debug = logger.isEnabledFor(logging.DEBUG)
     for count in itertools.count():
-        print(count)
+        if debug:
+            logger.debug("Unit of sand: %s", count)
         location = add_unit_of_sand(cave_grid)
         if location.type == LocationType.VOID:
             break
 
     # print(cave_grid.display_str())
-    print(f"Units of sand: {count}")
+    return count
 
 
-def part2(filename: str) -> None:
+def part2(filename: str) -> int:
     lines = yield_lines(filename)
     rock_grids = create_rock_grids(lines)
 
@@ -220,19 +221,21 @@ def part2(filename: str) -> None:
     )
     cave_grid.add_contained_grid(infiate_x_grid, False)
     count = 0
+    debug = logger.isEnabledFor(logging.DEBUG)
     for count in itertools.count(1):
-        print(count)
+        if debug:
+            logger.debug("Unit of sand: %s", count)
         location = add_unit_of_sand(cave_grid)
         if location.x == 500 and location.y == 0:
             break
 
     # print(cave_grid.display_str(Location(488, 0), Location(512, 12)))
-    print(f"Units of sand: {count}")
+    return count
 
 
 def main():
-    part1(FILENAME)
-    part2(FILENAME)
+    print(part1(FILENAME))
+    print(part2(FILENAME))
 
 
 if __name__ == "__main__":
@@ -1,15 +1,15 @@
 import dataclasses
 import enum
+import itertools
+import logging
 import operator
 import typing
 
-FILENAME = "day15_data.txt"
+from puzzle_input import yield_lines
 
+FILENAME = "day15_data.txt"
 
-def yield_lines(filename: str) -> typing.Iterator[str]:
-    with open(file=filename, mode="r") as read_file:
-        for line in read_file:
-            yield line.rstrip()
+logger = logging.getLogger(__name__)
 
 
 @enum.unique
@@ -132,7 +132,7 @@ def create_sensor(line: str) -> Sensor:
     return Sensor(sensor_location, beacon_location)
 
 
-def part1(filename: str) -> None:
+def part1(filename: str) -> int:
     lines = yield_lines(filename)
     sensors: list[Sensor] = []
     row_coverages: list[RowCoverage] = []
@@ -158,10 +158,10 @@ def part1(filename: str) -> None:
     merged_row_coverages.append(current_row_coverage)
     non_beacon_count = sum(row_coverage.count for row_coverage in merged_row_coverages)
     beacon_count = len(beacons_in_row)
-    print(non_beacon_count - beacon_count)
+    return non_beacon_count - beacon_count
 
 
-def part2(filename: str) -> None:
+def part2(filename: str) -> typing.Optional[int]:
     lines = yield_lines(filename)
     sensors: list[Sensor] = []
 
@@ -187,18 +187,18 @@ def part2(filename: str) -> None:
                 merged_row_coverages.append(current_row_coverage)
                 current_row_coverage = row_coverage
         merged_row_coverages.append(current_row_coverage)
-        if len(merged_row_coverages) > 1:
-            print(y_row, merged_row_coverages)
+        for left_coverage, right_coverage in itertools.pairwise(merged_row_coverages):
+            x = left_coverage.x_end + 1
+            if x < right_coverage.x_start and 0 <= x <= y_rows:
+                logger.debug("Found %s %s", y_row, merged_row_coverages)
+                return (x * 4000000) + y_row
 
-    # found 3249595 [RowCoverage(x_start=-933677, x_end=3340223), RowCoverage(x_start=3340225, x_end=4217259)]
-    x = 3340224
-    y = 3249595
-    print((x * 4000000) + y)
+    return None
 
 
 def main():
-    part1(FILENAME)
-    part2(FILENAME)
+    print(part1(FILENAME))
+    print(part2(FILENAME))
 
 
 if __name__ == "__main__":
@@ -2,13 +2,9 @@ import collections
 import dataclasses
 import typing
 
-FILENAME = "year2022\day18_data.txt"
-
+from puzzle_input import yield_lines
 
-def yield_lines(filename: str) -> typing.Iterator[str]:
-    with open(file=filename, mode="r") as read_file:
-        for line in read_file:
-            yield line.rstrip()
+FILENAME = "year2022\day18_data.txt"
 
 
 @dataclasses.dataclass(frozen=True)
@@ -84,13 +80,13 @@ def create_cubes(lines: typing.Iterator[str]) -> typing.Iterator[Cube]:
         yield Cube(coordinate, cube_size, face_coordinates)
 
 
-def part1(filename: str) -> None:
+def part1(filename: str) -> int:
     lines = yield_lines(filename)
     cube_faces = collections.Counter()
     for cube in create_cubes(lines):
         cube_faces.update(cube.faces)
     unique_faces = [key for key, value in cube_faces.items() if value == 1]
-    print(len(unique_faces))
+    return len(unique_faces)
 
 
 def part2(filename: str) -> None:
@@ -98,7 +94,7 @@ def part2(filename: str) -> None:
 
 
 def main():
-    part1(FILENAME)
+    print(part1(FILENAME))
     # part2(FILENAME)
 
 
@@ -0,0 +1,60 @@
+import mmap
+import typing
+
+try:
+    import numpy as np
+except ImportError:  # only needed for the NumPy backends
+    np = None
+
+BLOCK_SIZE = 1 << 20
+
+Buffer = typing.Union[bytes, mmap.mmap]
+
+
+def map_file(filename: str) -> Buffer:
+    with open(file=filename, mode="rb") as read_file:
+        try:
+            # The mapping outlives the file object and is unmapped once the
+            # last reference to it, including any line view, is dropped.
+            return mmap.mmap(read_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty files can't be mapped
+            return b""
+
+
+def require_numpy() -> None:
+    if np is None:
+        raise ImportError("The NumPy backend requires numpy to be installed")
+
+
+def yield_line_blocks(
+    data: Buffer, block_size: int = BLOCK_SIZE
+) -> typing.Iterator[bytes]:
+    start = 0
+    end_of_data = len(data)
+    while start < end_of_data:
+        if start + block_size >= end_of_data:
+            end = end_of_data
+        else:
+            end = data.rfind(b"\n", start, start + block_size) + 1
+            if not end:  # a single line longer than the block
+                end = data.find(b"\n", start + block_size) + 1 or end_of_data
+        yield data[start:end]
+        start = end
+
+
+def _yield_lines(
+    filename: str, strip: typing.Callable[[str], str]
+) -> typing.Iterator[str]:
+    for block in yield_line_blocks(map_file(filename)):
+        lines = block.decode().split("\n")
+        if block.endswith(b"\n"):
+            lines.pop()
+        yield from map(strip, lines)
+
+
+def yield_lines(filename: str) -> typing.Iterator[str]:
+    return _yield_lines(filename, str.rstrip)
+
+
+def yield_stripped_lines(filename: str) -> typing.Iterator[str]:
+    return _yield_lines(filename, str.strip)